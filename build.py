@@ -3,24 +3,138 @@
 Build script for creating standalone executables
 Supports macOS, Linux, and Windows
 
+Usage: python build.py [--profile {full-bundle,minimal,universal2}]
+- full-bundle (default): bundles Poppler and Tesseract, native architecture
+- minimal: no bundled Poppler/Tesseract and no icon, for quick local test builds
+- universal2: like full-bundle, but builds a universal2 app on macOS
+
 Note for macOS:
 - Builds architecture-specific binaries (arm64 or x86_64) rather than universal2
+  unless the universal2 profile is used
 - This is because some Python packages (like Pillow) may have thin single-arch 
   binaries that cannot be merged into universal2 executables
 - In GitHub Actions, we build separate binaries for ARM64 and Intel Macs
 
 Note for Poppler:
 - If poppler_binaries directory exists, Poppler will be bundled with the executable
+- Set STRICT_BUNDLE=1 to abort the build when no Poppler binaries are found
 - Users will still need to install Tesseract OCR separately
+
+Note for Tesseract:
+- Only the eng and osd language files are bundled (the app always OCRs in English);
+  set OCR_LANGS to bundle more, e.g. OCR_LANGS=deu+fra
+
+Note for Windows:
+- requirements.txt pins pefile to an older release on Windows (see PyInstaller
+  issue #8762): newer pefile versions make PyInstaller's binary-vs-data
+  classification take 20-30 minutes
+
+Note for incremental builds:
+- PyInstaller's work directory is kept in a persistent location (build/pyi-<key>,
+  override with the PYI_WORKPATH environment variable) and --clean is never passed,
+  so unchanged module graphs and binary classifications are reused between builds
+- <key> is a hash of the installed packages (pip freeze), also used in the spec file
+  name (QuickPdfOcr-<key>.spec), so caches are invalidated when a dependency changes
+- After a successful build the work directory is also archived to
+  ~/.cache/quickpdfocr-pyi/<hash>.tar (override with PYI_CACHE_DIR), where <hash>
+  covers the build script, the spec, the app sources and resources, the staged
+  Poppler tools, requirements.txt and <key>; a fresh checkout with a matching hash
+  restores it instead of starting from an empty work directory (PyInstaller still
+  rebuilds whatever its own timestamp checks find out of date); older archives are
+  deleted on save, so only the latest one is kept
+- CI caches ~/.cache/quickpdfocr-pyi keyed on the same inputs
+- For byte-identical output run with PYTHONHASHSEED=0 (PyInstaller runs in-process,
+  and the hash seed can only be set when the interpreter starts)
+- The PYZ archive is not rebuilt (or recompressed) when its module list is unchanged -
+  PyInstaller checks this against the cached TOC in the work directory, so no separate
+  compression cache is needed on top of the persistent workpath
+
+Note for distribution:
+- The app is built in --onedir mode so the bootloader doesn't have to unpack the
+  whole bundle to a temp directory on every launch
+- Release workflows archive dist/QuickPdfOcr (or QuickPdfOcr.app on macOS) for download
 """
 
 import sys
+import argparse
+import functools
+import hashlib
 import platform
 import subprocess
 import os
 import shutil
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Host platform, looked up once
+_SYSTEM = platform.system()
+_MACHINE = platform.machine()
+
+# Bundle directories whose binaries are UPX-compressed. UPX only pays off on
+# the large Poppler/Tesseract C++ binaries - the Python runtime, extension
+# modules, Qt and the system/runtime DLLs (MSVC runtime, OpenSSL, libffi, ...)
+# are loaded at every start, tend to break or trigger antivirus false positives
+# when packed, and are left alone.
+UPX_DIRS = ["poppler", "tesseract"]
+
+# Build profiles selectable with --profile
+# darwin_arch: target architecture on macOS (None = the host architecture)
+BUILD_PROFILES = {
+    "full-bundle": {"bundle_poppler": True, "bundle_tesseract": True, "darwin_arch": None, "icon": True},
+    "minimal": {"bundle_poppler": False, "bundle_tesseract": False, "darwin_arch": None, "icon": False},
+    "universal2": {"bundle_poppler": True, "bundle_tesseract": True, "darwin_arch": "universal2", "icon": True},
+}
+DEFAULT_PROFILE = "full-bundle"
+
+# Tesseract language data bundled by default - the app always OCRs with lang='eng',
+# and osd is Tesseract's orientation/script detection data
+DEFAULT_OCR_LANGS = ["eng", "osd"]
+
+# Qt plugins the app never uses, plus the Qt libraries that only they pull in
+# (the PDF image-format plugin brings QtPdf, the virtual keyboard brings
+# QtQuick/QtQml). Matched case-insensitively against every component of the
+# bundled path, so .dll/.so/.dylib files and macOS .framework bundles all match.
+QT_BINARY_EXCLUDES = [
+    "*qpdf.*",
+    "*qtvirtualkeyboardplugin.*",
+    "*qt6pdf*",
+    "qtpdf*",
+    "*qt6qml*",
+    "qtqml*",
+    "*qt6quick*",
+    "qtquick*",
+    "*qt6virtualkeyboard*",
+    "qtvirtualkeyboard*",
+]
+
+# Bytecode optimization level for bundled modules (2 = strip asserts and docstrings,
+# same as python -OO) - smaller PYZ archive and less to load at startup
+BYTECODE_OPTIMIZE = 2
+
+# Timestamp embedded in build output for reproducible builds
+REPRODUCIBLE_EPOCH = "1700000000"
+
+
+@functools.lru_cache(maxsize=None)
+def _brew_prefix(formula):
+    """
+    Get the Homebrew installation prefix of a formula
+    
+    Args:
+        formula (str): Homebrew formula name
+    
+    Returns:
+        Path or None: Installation prefix, or None if Homebrew or the formula is not available
+    """
+    try:
+        output = subprocess.check_output(
+            ["brew", "--prefix", formula], text=True, stderr=subprocess.DEVNULL
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return Path(output.strip())
+
 
 def find_poppler_binaries():
     """
@@ -29,7 +143,7 @@ def find_poppler_binaries():
     Returns:
         Path or None: Path to Poppler binaries directory, or None if not found
     """
-    system = platform.system()
+    system = _SYSTEM
     
     # Check for pre-downloaded binaries in poppler_binaries directory
     poppler_dir = Path("poppler_binaries")
@@ -39,6 +153,12 @@ def find_poppler_binaries():
     
     # Try to find system Poppler installation
     if system == "Darwin":  # macOS
+        # Ask Homebrew first - this also covers non-default Homebrew prefixes
+        brew_prefix = _brew_prefix("poppler")
+        if brew_prefix and (brew_prefix / "bin" / "pdftotext").exists():
+            print(f"Found system Poppler in: {brew_prefix / 'bin'}")
+            return brew_prefix / "bin"
+        
         # Check Homebrew installation paths
         homebrew_paths = [
             Path("/opt/homebrew/bin"),  # ARM64 Homebrew
@@ -71,7 +191,7 @@ def find_tesseract_binaries():
     Returns:
         Path or None: Path to Tesseract installation directory, or None if not found
     """
-    system = platform.system()
+    system = _SYSTEM
     
     # Check for pre-downloaded binaries in tesseract_binaries directory
     tesseract_dir = Path("tesseract_binaries")
@@ -115,61 +235,580 @@ def find_tesseract_binaries():
 
 
 
-def build_executable():
-    """Build standalone executable using PyInstaller"""
+# Poppler executables bundled on macOS and Linux
+POPPLER_TOOLS = [
+    "pdftotext", "pdftoppm", "pdfinfo", "pdfimages",
+    "pdftocairo", "pdftohtml", "pdftops", "pdfunite", "pdfseparate"
+]
+
+# Staging directory holding only the Poppler tools that get bundled
+POPPLER_STAGE_DIR = Path("build/poppler_stage")
+
+# Archived PyInstaller work directories, keyed on source_tree_hash()
+BUILD_CACHE_DIR = Path(os.environ.get("PYI_CACHE_DIR", Path.home() / ".cache" / "quickpdfocr-pyi"))
+
+# Inputs that change what goes into the spec file; the spec is regenerated
+# whenever any of them is newer than the existing spec
+SPEC_INPUTS = [Path("build.py"), Path("main.py"), Path("poppler_binaries"), Path("tesseract_binaries")]
+
+SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by build.py - do not edit, changes will be overwritten
+{settings}import fnmatch
+import glob
+from pathlib import PurePath
+
+from PyInstaller.utils.hooks import collect_all
+
+binaries = {binaries}
+datas = {datas}
+hiddenimports = {hiddenimports}
+
+# Collect all necessary packages to ensure complete bundling. The modules are
+# frozen into the PYZ as headerless code objects (nothing to re-validate at
+# import time), so raw .py copies of them would only be dead weight
+for package in {collect_all!r}:
+    package_datas, package_binaries, package_hiddenimports = collect_all(package, include_py_files=False)
+    datas += package_datas
+    binaries += package_binaries
+    hiddenimports += package_hiddenimports
+
+a = Analysis(
+    {scripts!r},
+    pathex=[],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes={excludes},
+    noarchive=False,
+    optimize={optimize!r},
+)
+
+# The Qt hooks collect every plugin of a category - drop the unused ones
+qt_binary_excludes = {qt_binary_excludes}
+
+def _keep(entry):
+    parts = PurePath(entry[0]).parts
+    return not any(fnmatch.fnmatch(part.lower(), pattern) for part in parts for pattern in qt_binary_excludes)
+
+a.binaries = [entry for entry in a.binaries if _keep(entry)]
+a.datas = [entry for entry in a.datas if _keep(entry)]
+
+# UPX is an allowlist: every binary outside the UPX directories is excluded
+# by its exact source path
+upx_dirs = {upx_dirs!r}
+upx_exclude = [
+    glob.escape(src) for dest, src, typecode in a.binaries
+    if PurePath(dest).parts[0] not in upx_dirs
+]
+
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name={name!r},
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch={target_arch!r},
+    codesign_identity=None,
+    entitlements_file=None,
+    icon={icon!r},
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=upx_exclude,
+    name={name!r},
+)
+"""
+
+# macOS windowed builds are additionally wrapped in an .app bundle
+SPEC_BUNDLE_TEMPLATE = """app = BUNDLE(
+    coll,
+    name={name!r} + '.app',
+    icon={icon!r},
+    bundle_identifier=None,
+)
+"""
+
+
+def _format_spec_list(entries):
+    """
+    Format a list for the spec file with one entry per line
     
-    system = platform.system()
-    print(f"Building for {system}...")
+    Args:
+        entries (list): Entries to format
     
-    # Find Poppler and Tesseract binaries
-    poppler_path = find_poppler_binaries()
-    tesseract_path = find_tesseract_binaries()
-    
-    # Base PyInstaller command - use sys.executable to ensure we use the venv's Python
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--name=QuickPdfOcr",
-        "--windowed",  # No console window
-        "--onefile",   # Single executable
-        "--noconfirm", # Overwrite without asking
+    Returns:
+        str: Python source for the list
+    """
+    if not entries:
+        return "[]"
+    return "[\n" + "".join(f"    {entry!r},\n" for entry in entries) + "]"
+
+
+def _list_dir_names(directory):
+    """
+    List the entry names of a directory with a single scandir pass
+    
+    Args:
+        directory (Path): Directory to list
+    
+    Returns:
+        set: Names of the entries in the directory (empty if it can't be read)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def _list_files(directory, suffix=""):
+    """
+    List the regular files of a directory with a single scandir pass
+    
+    The file type comes from the directory entry itself, so no extra stat()
+    is needed per file.
+    
+    Args:
+        directory (Path): Directory to list
+        suffix (str): Only return files whose name ends with this (case-insensitive)
+    
+    Returns:
+        list: Sorted Paths of the matching files (empty if the directory can't be read)
+    """
+    suffix = suffix.lower()
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.lower().endswith(suffix) and entry.is_file(follow_symlinks=False)
+            )
+    except OSError:
+        return []
+
+
+def _existing_paths(paths):
+    """
+    Check which of the given paths exist, issuing the stat() calls concurrently
+    
+    os.stat() releases the GIL, so on slow filesystems (network mounts, overlayfs
+    in CI containers) the probes overlap instead of queueing one after another.
+    
+    Args:
+        paths (list): Paths to check
+    
+    Returns:
+        set: The paths that exist
+    """
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        return {path for path, exists in zip(paths, executor.map(os.path.exists, paths)) if exists}
+
+
+def _tessdata_locations(system, tesseract_path):
+    """
+    List the possible tessdata directories of a Tesseract installation
+    
+    Args:
+        system (str): Platform name as returned by platform.system()
+        tesseract_path (Path): Tesseract installation directory
+    
+    Returns:
+        list: Candidate tessdata directories, most likely first
+    """
+    if system == "Windows":
+        return [tesseract_path / "tessdata"]
+    if system == "Darwin":
+        return [
+            tesseract_path / "share" / "tessdata",  # Homebrew standard location
+            tesseract_path / "share" / "tesseract-ocr" / "tessdata",  # Alternative location
+        ]
+    return [
+        tesseract_path / "share" / "tessdata",  # Old location
+        tesseract_path / "share" / "tesseract-ocr" / "5" / "tessdata",  # Ubuntu 24.04+
+        tesseract_path / "share" / "tesseract-ocr" / "4" / "tessdata",  # Ubuntu 20.04
+        tesseract_path / "share" / "tesseract-ocr" / "tessdata",  # Generic
+    ]
+
+
+def bundled_ocr_langs():
+    """
+    Get the Tesseract languages to bundle
+    
+    Returns:
+        list: DEFAULT_OCR_LANGS plus any languages listed in the OCR_LANGS
+              environment variable ('+' or ',' separated)
+    """
+    extra = os.environ.get("OCR_LANGS", "").replace(",", "+").split("+")
+    return list(dict.fromkeys(DEFAULT_OCR_LANGS + [lang.strip() for lang in extra if lang.strip()]))
+
+
+def _tessdata_entries(tessdata_path, langs):
+    """
+    Select the tessdata files to bundle for the given languages
+    
+    Args:
+        tessdata_path (Path): Tesseract tessdata directory
+        langs (list): Language codes to bundle
+    
+    Returns:
+        tuple: (datas entries, list of languages found)
+    """
+    names = _list_dir_names(tessdata_path)
+    found = [lang for lang in langs if f"{lang}.traineddata" in names]
+    for lang in langs:
+        if lang not in found and names:
+            print(f"  Warning: {lang}.traineddata not found in: {tessdata_path}")
+    datas = [(str(tessdata_path / f"{lang}.traineddata"), "tesseract/tessdata") for lang in found]
+    
+    # Keep the small config directories (used by output formats such as tsv/hocr)
+    for config_dir in ("configs", "tessconfigs"):
+        if config_dir in names:
+            datas.append((str(tessdata_path / config_dir), f"tesseract/tessdata/{config_dir}"))
+    
+    return datas, found
+
+
+def stage_poppler_tools(poppler_path):
+    """
+    Copy the Poppler executables to bundle into the staging directory
+    
+    Args:
+        poppler_path (Path): Directory containing the Poppler executables
+    
+    Returns:
+        list: Names of the staged tools
+    """
+    if POPPLER_STAGE_DIR.exists():
+        shutil.rmtree(POPPLER_STAGE_DIR)
+    POPPLER_STAGE_DIR.mkdir(parents=True)
+    
+    # One directory listing instead of a stat() per tool
+    present = _list_dir_names(poppler_path)
+    staged = [tool for tool in POPPLER_TOOLS if tool in present]
+    
+    # Copies are I/O bound - overlap them so cold-cache CI disks don't serialize them
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(
+            lambda tool: shutil.copy2(poppler_path / tool, POPPLER_STAGE_DIR / tool),
+            staged
+        ))
+    
+    return staged
+
+
+def ensure_prebuilt_bootloader():
+    """
+    Make sure PyInstaller ships a prebuilt bootloader for this platform
+    
+    PyInstaller installed from an sdist on less common platforms (e.g. ARM64 runners)
+    may be missing the bootloader and fall back to compiling it. The build stops
+    with instructions instead of changing the installed packages itself.
+    
+    Raises:
+        SystemExit: If the bootloader is missing
+    """
+    try:
+        import PyInstaller
+    except ImportError:
+        print("Warning: PyInstaller is not installed")
+        return
+    
+    exe_name = "run.exe" if _SYSTEM == "Windows" else "run"
+    bootloader = Path(PyInstaller.__file__).parent / "bootloader" / PyInstaller.PLATFORM / exe_name
+    if bootloader.exists():
+        return
+    
+    sys.exit(
+        f"Prebuilt PyInstaller bootloader not found at: {bootloader}\n"
+        "Reinstall PyInstaller from a binary wheel and run the build again:\n"
+        f"  {sys.executable} -m pip install --force-reinstall --only-binary=:all: pyinstaller"
+    )
+
+
+def dependency_cache_key():
+    """
+    Compute a cache key from the resolved Python environment
+    
+    Returns:
+        str: Short content hash of the installed packages
+    """
+    freeze = subprocess.check_output([sys.executable, "-m", "pip", "freeze"])
+    return hashlib.sha256(freeze).hexdigest()[:12]
+
+
+def source_tree_hash(cache_key, spec_file):
+    """
+    Compute a hash of the project files that go into the PyInstaller build
+    
+    The hash only names the cache archive - PyInstaller still compares the
+    restored work directory against its inputs and rebuilds what changed.
+    
+    Args:
+        cache_key (str): Dependency cache key from dependency_cache_key()
+        spec_file (Path): Spec file of the build (lists the bundled binaries)
+    
+    Returns:
+        str: Short content hash of the build script, spec, app sources, resources,
+             staged Poppler tools and dependencies
+    """
+    paths = [Path("build.py"), Path("main.py"), Path("requirements.txt"), spec_file]
+    for directory in (Path("components"), Path("ui"), Path("resources"), POPPLER_STAGE_DIR):
+        paths += sorted(
+            path for path in directory.rglob("*")
+            if path.is_file() and "__pycache__" not in path.parts
+        )
+    
+    digest = hashlib.sha256(cache_key.encode())
+    for path in paths:
+        if path.exists():
+            digest.update(path.as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def restore_build_cache(workpath, tree_hash):
+    """
+    Restore an archived PyInstaller work directory for an identical source tree
+    
+    Args:
+        workpath (str): PyInstaller work directory
+        tree_hash (str): Hash from source_tree_hash()
+    
+    Returns:
+        bool: True if the work directory was restored from the cache
+    """
+    archive = BUILD_CACHE_DIR / f"{tree_hash}.tar"
+    if Path(workpath).exists() or not archive.exists():
+        return False
+    
+    print(f"Restoring PyInstaller cache: {archive}")
+    try:
+        with tarfile.open(archive) as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(workpath, filter="data")
+            else:
+                tar.extractall(workpath)
+    except (OSError, tarfile.TarError) as e:
+        print(f"Warning: Could not restore PyInstaller cache: {e}")
+        shutil.rmtree(workpath, ignore_errors=True)
+        return False
+    
+    # The archived files keep their build times, so PyInstaller's own mtime
+    # checks still rebuild any stage whose inputs are newer
+    return True
+
+
+def save_build_cache(workpath, tree_hash):
+    """
+    Archive the PyInstaller work directory for later builds of the same source tree
+    
+    Args:
+        workpath (str): PyInstaller work directory
+        tree_hash (str): Hash from source_tree_hash()
+    """
+    archive = BUILD_CACHE_DIR / f"{tree_hash}.tar"
+    if not Path(workpath).is_dir():
+        return
+    
+    # Uncompressed: the PYZ and binaries inside are already compressed, and CI
+    # caches compress the directory on upload anyway
+    if not archive.exists():
+        try:
+            BUILD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            partial = archive.with_suffix(".tar.partial")
+            with tarfile.open(partial, "w") as tar:
+                tar.add(workpath, arcname=".")
+            os.replace(partial, archive)
+            print(f"Saved PyInstaller cache: {archive}")
+        except (OSError, tarfile.TarError) as e:
+            print(f"Warning: Could not save PyInstaller cache: {e}")
+            return
+    
+    # Only the latest archive is worth keeping: older ones belong to source trees
+    # that will not be built again, and CI would otherwise carry them forward
+    # through restore-keys on every run
+    for stale in BUILD_CACHE_DIR.glob("*.tar*"):
+        if stale != archive:
+            try:
+                stale.unlink()
+            except OSError as e:
+                print(f"Warning: Could not remove old PyInstaller cache {stale}: {e}")
+
+
+def spec_settings(profile, poppler_path, tesseract_path):
+    """
+    Describe the build settings a spec file is generated for
+    
+    Args:
+        profile (str): Build profile name
+        poppler_path (Path or None): Poppler binaries directory to bundle
+        tesseract_path (Path or None): Tesseract installation directory to bundle
+    
+    Returns:
+        str: Comment lines recorded in the spec header
+    """
+    return (
+        f"# Build profile: {profile}\n"
+        f"# OCR languages: {'+'.join(bundled_ocr_langs())}\n"
+        f"# Poppler: {poppler_path or 'not bundled'}\n"
+        f"# Tesseract: {tesseract_path or 'not bundled'}\n"
+    )
+
+
+def spec_is_stale(spec_file, profile, poppler_path, tesseract_path):
+    """
+    Check whether the spec file needs to be regenerated
+    
+    Args:
+        spec_file (Path): Spec file to check
+        profile (str): Build profile name
+        poppler_path (Path or None): Poppler binaries directory to bundle
+        tesseract_path (Path or None): Tesseract installation directory to bundle
+    
+    Returns:
+        bool: True if the spec file is missing, older than any of its inputs
+              (including the detected Poppler/Tesseract directories) or was
+              written for a different profile, OCR languages or binary locations
+    """
+    if not spec_file.exists():
+        return True
+    
+    spec_mtime = spec_file.stat().st_mtime
+    for path in SPEC_INPUTS + [path for path in (poppler_path, tesseract_path) if path]:
+        if path.exists() and path.stat().st_mtime > spec_mtime:
+            print(f"Spec file is out of date ({path} changed)")
+            return True
+    
+    # Settings taken from the command line and environment, and the binaries
+    # found on this machine (e.g. a Poppler installed since), are recorded in
+    # the spec header
+    if spec_settings(profile, poppler_path, tesseract_path) not in spec_file.read_text():
+        print("Spec file is out of date (profile, OCR_LANGS or detected binaries changed)")
+        return True
+    return False
+
+
+def generate_spec(spec_file, system, poppler_path, tesseract_path, profile=DEFAULT_PROFILE):
+    """
+    Write the PyInstaller spec file for the current platform
+    
+    Args:
+        spec_file (Path): Spec file to write
+        system (str): Platform name as returned by platform.system()
+        poppler_path (Path or None): Poppler binaries directory to bundle
+        tesseract_path (Path or None): Tesseract installation directory to bundle
+        profile (str): Build profile name (key of BUILD_PROFILES)
+    """
+    settings = BUILD_PROFILES[profile]
+    binaries = []
+    datas = []
+    
+    # Only the Tesseract languages the app can actually use
+    ocr_langs = bundled_ocr_langs()
+    
+    # Hidden imports for PySide6 and other dependencies
+    hiddenimports = [
+        "PySide6.QtCore",
+        "PySide6.QtGui",
+        "PySide6.QtWidgets",
+        "pytesseract",
+        "pdf2image",
+        "PIL",
+        "PIL.Image",
+        "PyPDF2",
     ]
+    # PySide6 is not collected wholesale - its hooks already pull in the Qt
+    # plugins (platforms, styles, imageformats) needed by the imported modules
+    collect_all_packages = ["pdf2image", "pytesseract"]
     
-    # Add target architecture for macOS
+    # The app only uses QtCore/QtGui/QtWidgets - keep the rest of Qt out of the bundle
+    excludes = [
+        "PySide6.Qt3DAnimation",
+        "PySide6.Qt3DCore",
+        "PySide6.Qt3DExtras",
+        "PySide6.Qt3DInput",
+        "PySide6.Qt3DLogic",
+        "PySide6.Qt3DRender",
+        "PySide6.QtWebEngineCore",
+        "PySide6.QtWebEngineQuick",
+        "PySide6.QtWebEngineWidgets",
+        "PySide6.QtMultimedia",
+        "PySide6.QtMultimediaWidgets",
+        "PySide6.QtQuick",
+        "PySide6.QtQuick3D",
+        "PySide6.QtQuickControls2",
+        "PySide6.QtQuickWidgets",
+        "PySide6.QtCharts",
+        "PySide6.QtDataVisualization",
+        "PySide6.QtQml",
+        "PySide6.QtPdf",
+        "PySide6.QtPdfWidgets",
+        "PySide6.QtSql",
+        "PySide6.QtBluetooth",
+        "PySide6.QtNfc",
+        "PySide6.QtSensors",
+        "PySide6.QtPositioning",
+        "PySide6.QtNetworkAuth",
+        # Standard library and third-party modules the app never imports
+        "tkinter",
+        "unittest",
+        "pydoc",
+        "xmlrpc",
+        "distutils",
+        "test",
+        "turtledemo",
+        "pdb",
+        "lib2to3",
+        "numpy.tests",
+        "PIL.ImageQt",  # Images are passed to Tesseract, never shown in Qt
+        # PyInstaller appends "__main__" to the excludes list in place during
+        # analysis; listing it up front keeps the cached Analysis TOC matching
+        # the spec, otherwise every build re-runs the full analysis
+        "__main__",
+    ]
+    
+    # Build for the current architecture only on macOS (unless the profile says otherwise)
     # Note: Building architecture-specific binaries instead of universal2
     # because some dependencies (like Pillow's _webp module) may not be universal2
-    if system == "Darwin":  # macOS
-        arch = platform.machine()
-        # Build for the current architecture only
-        cmd.extend([f"--target-arch={arch}"])
-    
-    cmd.append("main.py")
+    target_arch = (settings["darwin_arch"] or _MACHINE) if system == "Darwin" else None
     
-    # Add icon based on platform
-    if system == "Darwin":  # macOS
-        cmd.extend(["--icon=resources/icon.icns"])
+    # Icon based on platform
+    if not settings["icon"]:
+        icon = None
+    elif system == "Darwin":  # macOS
+        icon = ["resources/icon.icns"]
     elif system == "Windows":
-        cmd.extend(["--icon=resources/icon.ico"])
-    elif system == "Linux":
-        cmd.extend(["--icon=resources/icon.png"])
-    
-    # Add hidden imports for PySide6 and other dependencies
-    cmd.extend([
-        "--hidden-import=PySide6.QtCore",
-        "--hidden-import=PySide6.QtGui",
-        "--hidden-import=PySide6.QtWidgets",
-        "--hidden-import=pytesseract",
-        "--hidden-import=pdf2image",
-        "--hidden-import=PIL",
-        "--hidden-import=PIL.Image",
-        "--hidden-import=PyPDF2",
-    ])
-    
-    # Collect all necessary packages to ensure complete bundling
-    cmd.extend([
-        "--collect-all=PySide6",
-        "--collect-all=pdf2image",
-        "--collect-all=pytesseract",
-    ])
+        icon = ["resources/icon.ico"]
+    else:
+        icon = ["resources/icon.png"]
+    
+    # Probe every optional input in one concurrent batch up front
+    license_files = [Path("LICENSE"), Path("THIRD_PARTY_LICENSES.md")]
+    resources_dir = Path("resources")
+    candidates = [*license_files, resources_dir]
+    if poppler_path and system == "Windows":
+        candidates += [poppler_path / "Library" / "bin", poppler_path / "bin"]
+    tessdata_locations = []
+    if tesseract_path:
+        tessdata_locations = _tessdata_locations(system, tesseract_path)
+        candidates += [tesseract_path / "tesseract.exe", tesseract_path / "bin" / "tesseract"]
+        candidates += tessdata_locations
+    existing = _existing_paths(candidates)
     
     # Bundle Poppler binaries if found
     if poppler_path:
@@ -178,52 +817,19 @@ def build_executable():
         if system == "Windows":
             # For Windows, bundle all DLLs and executables
             bin_path = poppler_path / "Library" / "bin"
-            if bin_path.exists():
-                # Bundle all files from Library/bin directory
-                for item in bin_path.glob("*"):
-                    if item.is_file():
-                        cmd.extend([
-                            f"--add-binary={item}{os.pathsep}poppler/bin",
-                        ])
-                print(f"  Added: {bin_path} (all files)")
-            else:
+            if bin_path not in existing:
                 # If not in Library/bin, try direct bin folder
                 bin_path = poppler_path / "bin"
-                if bin_path.exists():
-                    for item in bin_path.glob("*"):
-                        if item.is_file():
-                            cmd.extend([
-                                f"--add-binary={item}{os.pathsep}poppler/bin",
-                            ])
-                    print(f"  Added: {bin_path} (all files)")
-        
-        elif system == "Darwin":  # macOS
-            # Bundle specific Poppler executables for macOS
-            poppler_tools = [
-                "pdftotext", "pdftoppm", "pdfinfo", "pdfimages",
-                "pdftocairo", "pdftohtml", "pdftops", "pdfunite", "pdfseparate"
-            ]
-            for tool in poppler_tools:
-                tool_path = poppler_path / tool
-                if tool_path.exists():
-                    cmd.extend([
-                        f"--add-binary={tool_path}{os.pathsep}poppler/bin",
-                    ])
-                    print(f"  Added: {tool}")
+            if bin_path in existing:
+                # Bundle all files from the bin directory
+                binaries += [(str(item), "poppler/bin") for item in _list_files(bin_path)]
+                print(f"  Added: {bin_path} (all files)")
         
-        elif system == "Linux":
-            # Bundle specific Poppler executables for Linux
-            poppler_tools = [
-                "pdftotext", "pdftoppm", "pdfinfo", "pdfimages",
-                "pdftocairo", "pdftohtml", "pdftops", "pdfunite", "pdfseparate"
-            ]
-            for tool in poppler_tools:
-                tool_path = poppler_path / tool
-                if tool_path.exists():
-                    cmd.extend([
-                        f"--add-binary={tool_path}{os.pathsep}poppler/bin",
-                    ])
-                    print(f"  Added: {tool}")
+        elif system in ("Darwin", "Linux"):
+            # The Poppler executables are staged by stage_poppler_tools() so the
+            # whole set can be bundled as a single directory entry
+            binaries.append((str(POPPLER_STAGE_DIR), "poppler/bin"))
+            print(f"  Added: {POPPLER_STAGE_DIR} (staged tools)")
     
     # Bundle Tesseract binaries if found
     if tesseract_path:
@@ -231,190 +837,244 @@ def build_executable():
         
         if system == "Windows":
             # For Windows, bundle tesseract.exe and all DLLs
-            if (tesseract_path / "tesseract.exe").exists():
-                cmd.extend([
-                    f"--add-binary={tesseract_path / 'tesseract.exe'}{os.pathsep}tesseract",
-                ])
+            if tesseract_path / "tesseract.exe" in existing:
+                binaries.append((str(tesseract_path / "tesseract.exe"), "tesseract"))
                 print(f"  Added: tesseract.exe")
                 
                 # Add all DLLs
-                dll_count = 0
-                for dll in tesseract_path.glob("*.dll"):
-                    cmd.extend([
-                        f"--add-binary={dll}{os.pathsep}tesseract",
-                    ])
-                    dll_count += 1
+                dlls = _list_files(tesseract_path, ".dll")
+                binaries += [(str(dll), "tesseract") for dll in dlls]
+                dll_count = len(dlls)
                 if dll_count > 0:
                     print(f"  Added: {dll_count} DLL files")
                 
                 # Add tessdata directory if it exists
-                tessdata_path = tesseract_path / "tessdata"
-                if tessdata_path.exists() and tessdata_path.is_dir():
-                    # Count language files
-                    traineddata_files = list(tessdata_path.glob("*.traineddata"))
-                    if not traineddata_files:
-                        print(f"  Warning: tessdata directory found but contains no .traineddata files!")
+                tessdata_path = tessdata_locations[0]
+                if tessdata_path in existing and tessdata_path.is_dir():
+                    tessdata_datas, found_langs = _tessdata_entries(tessdata_path, ocr_langs)
+                    if not found_langs:
+                        print(f"  Warning: tessdata directory found but contains none of: {', '.join(ocr_langs)}")
                         print(f"  Please ensure language files are installed in: {tessdata_path}")
                     else:
-                        # Convert Path to string and normalize separators for the platform
-                        tessdata_str = str(tessdata_path)
-                        cmd.extend([
-                            f"--add-data={tessdata_str}{os.pathsep}tesseract/tessdata",
-                        ])
-                        print(f"  Added: tessdata directory ({len(traineddata_files)} language files)")
-                        print(f"  Source: {tessdata_str}")
+                        datas += tessdata_datas
+                        print(f"  Added: {len(found_langs)} language files ({', '.join(found_langs)})")
+                        print(f"  Source: {tessdata_path}")
                         print(f"  Destination in bundle: tesseract/tessdata")
                 else:
-                    print(f"  Warning: tessdata directory not found at: {tesseract_path / 'tessdata'}")
+                    print(f"  Warning: tessdata directory not found at: {tessdata_path}")
                     print(f"  OCR will not work in the bundled executable!")
                     print(f"  Please install Tesseract language data files.")
         
-        elif system == "Darwin":  # macOS
+        elif system in ("Darwin", "Linux"):
             # Bundle Tesseract executable and data
             tesseract_bin = tesseract_path / "bin" / "tesseract"
-            if tesseract_bin.exists():
-                cmd.extend([
-                    f"--add-binary={tesseract_bin}{os.pathsep}tesseract/bin",
-                ])
-                print(f"  Added: tesseract binary")
-            
-            # Add tessdata directory - try multiple possible locations
-            tessdata_locations = [
-                tesseract_path / "share" / "tessdata",  # Homebrew standard location
-                tesseract_path / "share" / "tesseract-ocr" / "tessdata",  # Alternative location
-            ]
-            
-            tessdata_path = None
-            for loc in tessdata_locations:
-                if loc.exists():
-                    tessdata_path = loc
-                    break
-            
-            if tessdata_path:
-                # Count language files
-                traineddata_files = list(tessdata_path.glob("*.traineddata"))
-                # Convert Path to string for PyInstaller
-                tessdata_str = str(tessdata_path)
-                cmd.extend([
-                    f"--add-data={tessdata_str}{os.pathsep}tesseract/tessdata",
-                ])
-                print(f"  Added: tessdata directory ({len(traineddata_files)} language files)")
-                print(f"  Source: {tessdata_str}")
-                print(f"  Destination in bundle: tesseract/tessdata")
-            else:
-                print(f"  Warning: tessdata directory not found in any expected location")
-        
-        elif system == "Linux":
-            # Bundle Tesseract executable and data
-            tesseract_bin = tesseract_path / "bin" / "tesseract"
-            if tesseract_bin.exists():
-                cmd.extend([
-                    f"--add-binary={tesseract_bin}{os.pathsep}tesseract/bin",
-                ])
+            if tesseract_bin in existing:
+                binaries.append((str(tesseract_bin), "tesseract/bin"))
                 print(f"  Added: tesseract binary")
             
-            # Add tessdata directory - try multiple possible locations
-            tessdata_locations = [
-                tesseract_path / "share" / "tessdata",  # Old location
-                tesseract_path / "share" / "tesseract-ocr" / "5" / "tessdata",  # Ubuntu 24.04+
-                tesseract_path / "share" / "tesseract-ocr" / "4" / "tessdata",  # Ubuntu 20.04
-                tesseract_path / "share" / "tesseract-ocr" / "tessdata",  # Generic
-            ]
-            
-            tessdata_path = None
-            for loc in tessdata_locations:
-                if loc.exists():
-                    tessdata_path = loc
-                    break
+            # Add tessdata directory - use the first of the possible locations that exists
+            tessdata_path = next((loc for loc in tessdata_locations if loc in existing), None)
             
             if tessdata_path:
-                # Count language files
-                traineddata_files = list(tessdata_path.glob("*.traineddata"))
-                # Convert Path to string for PyInstaller
-                tessdata_str = str(tessdata_path)
-                cmd.extend([
-                    f"--add-data={tessdata_str}{os.pathsep}tesseract/tessdata",
-                ])
-                print(f"  Added: tessdata directory ({len(traineddata_files)} language files)")
-                print(f"  Source: {tessdata_str}")
+                tessdata_datas, found_langs = _tessdata_entries(tessdata_path, ocr_langs)
+                datas += tessdata_datas
+                print(f"  Added: {len(found_langs)} language files ({', '.join(found_langs)})")
+                print(f"  Source: {tessdata_path}")
                 print(f"  Destination in bundle: tesseract/tessdata")
             else:
                 print(f"  Warning: tessdata directory not found in any expected location")
     
     # Add license files as data
-    license_files = ["LICENSE", "THIRD_PARTY_LICENSES.md"]
     for license_file in license_files:
-        if Path(license_file).exists():
-            cmd.extend([
-                f"--add-data={license_file}{os.pathsep}.",
-            ])
+        if license_file in existing:
+            datas.append((str(license_file), "."))
             print(f"Including license file: {license_file}")
     
     # Add resources directory (icons)
-    resources_dir = Path("resources")
-    if resources_dir.exists():
-        cmd.extend([
-            f"--add-data={resources_dir}{os.pathsep}resources",
-        ])
+    if resources_dir in existing:
+        datas.append((str(resources_dir), "resources"))
         print(f"Including resources directory: {resources_dir}")
     
-    # Run PyInstaller
-    try:
-        print("\n" + "="*60)
-        print("STARTING PYINSTALLER BUILD")
-        print("="*60)
-        print("This may take several minutes...\n")
-        
-        subprocess.run(cmd, check=True)
-        
-        print("\n" + "="*60)
-        print("BUILD SUCCESSFUL!")
-        print("="*60)
-        print(f"\nExecutable location: dist/QuickPdfOcr")
-        
-        print("\nBUNDLED COMPONENTS:")
-        print("  [OK] Python interpreter (users do NOT need Python installed)")
-        print("  [OK] All Python packages (PySide6, pytesseract, pdf2image, Pillow, PyPDF2)")
-        
-        if poppler_path:
-            print("  [OK] Poppler binaries (users do NOT need to install Poppler)")
-        else:
-            print("  [WARN] Poppler NOT bundled (users must install Poppler separately)")
+    spec = SPEC_TEMPLATE.format(
+        binaries=_format_spec_list(binaries),
+        datas=_format_spec_list(datas),
+        hiddenimports=_format_spec_list(hiddenimports),
+        excludes=_format_spec_list(excludes),
+        upx_dirs=UPX_DIRS,
+        qt_binary_excludes=_format_spec_list(QT_BINARY_EXCLUDES),
+        optimize=BYTECODE_OPTIMIZE,
+        settings=spec_settings(profile, poppler_path, tesseract_path),
+        collect_all=collect_all_packages,
+        scripts=["main.py"],
+        name="QuickPdfOcr",
+        target_arch=target_arch,
+        icon=icon,
+    )
+    if system == "Darwin":
+        spec += SPEC_BUNDLE_TEMPLATE.format(name="QuickPdfOcr", icon=icon)
+    
+    spec_file.write_text(spec, encoding="utf-8")
+    print(f"\nWrote spec file: {spec_file}")
+
+
+def run_pyinstaller(spec_file, workpath):
+    """
+    Run PyInstaller on a spec file inside the current interpreter
+    
+    Args:
+        spec_file (Path): Spec file to build
+        workpath (str): PyInstaller work directory to (re)use
+    
+    Raises:
+        SystemExit: If PyInstaller fails
+    """
+    args = [
+        "--noconfirm", # Overwrite without asking
+        # Persistent work/dist paths so PyInstaller can reuse previous analysis
+        # (never pass --clean, which would throw the cache away)
+        f"--workpath={workpath}",
+        "--distpath=dist",
+    ]
+    
+    # Compress bundled binaries with UPX when it is installed
+    upx_path = shutil.which("upx")
+    if upx_path:
+        print(f"Using UPX from: {upx_path}")
+        args.append(f"--upx-dir={Path(upx_path).parent}")
+    
+    args.append(str(spec_file))
+    
+    print("\n" + "="*60)
+    print("STARTING PYINSTALLER BUILD")
+    print("="*60)
+    print("This may take several minutes...\n")
+    
+    # Fixed timestamps so identical inputs give byte-identical output that external
+    # caches can match on (an existing SOURCE_DATE_EPOCH is respected)
+    os.environ.setdefault("SOURCE_DATE_EPOCH", REPRODUCIBLE_EPOCH)
+    
+    # Run in-process instead of spawning a second interpreter that has to
+    # re-import PyInstaller - output streams straight to our stdout/stderr
+    from PyInstaller.__main__ import run as pyi_run
+    pyi_run(args)
+
+
+def build_executable(profile=DEFAULT_PROFILE):
+    """
+    Build standalone executable using PyInstaller
+    
+    Args:
+        profile (str): Build profile name (key of BUILD_PROFILES)
+    """
+    settings = BUILD_PROFILES[profile]
+    system = _SYSTEM
+    print(f"Building for {system} (profile: {profile})...")
+    
+    # Find Poppler and Tesseract binaries
+    poppler_path = find_poppler_binaries() if settings["bundle_poppler"] else None
+    tesseract_path = find_tesseract_binaries() if settings["bundle_tesseract"] else None
+    
+    # Fail fast instead of spending the whole build on a degraded binary
+    if settings["bundle_poppler"] and poppler_path is None and os.environ.get("STRICT_BUNDLE") == "1":
+        sys.exit("Refusing to build without Poppler (STRICT_BUNDLE=1)")
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Stage Poppler tools on every build (the spec only references the staging
+        # directory) - the copies run in the background while the build is prepared
+        staging = None
+        if poppler_path and system in ("Darwin", "Linux"):
+            staging = executor.submit(stage_poppler_tools, poppler_path)
         
-        if tesseract_path:
-            print("  [OK] Tesseract OCR (users do NOT need to install Tesseract)")
-        else:
-            print("  [WARN] Tesseract NOT bundled (users must install Tesseract separately)")
+        ensure_prebuilt_bootloader()
         
-        if not poppler_path or not tesseract_path:
-            print("\n[WARNING] EXTERNAL DEPENDENCIES (must be installed separately):")
-            if not poppler_path:
-                print("  - Poppler (for PDF processing)")
-            if not tesseract_path:
-                print("  - Tesseract OCR (required for text recognition)")
-            print("\nInstallation instructions:")
-            print("    - macOS: brew install tesseract" if not tesseract_path else "")
-            if not poppler_path:
-                print("    - macOS: brew install poppler")
-            print("    - Linux: sudo apt-get install tesseract-ocr" if not tesseract_path else "")
-            if not poppler_path:
-                print("    - Linux: sudo apt-get install poppler-utils")
-            print("    - Windows: https://github.com/UB-Mannheim/tesseract/wiki" if not tesseract_path else "")
-            if not poppler_path:
-                print("    - Windows: https://github.com/oschwartz10612/poppler-windows/releases/")
+        # Key the spec and work directory on the installed packages so a
+        # dependency change starts from a fresh cache automatically
+        cache_key = dependency_cache_key()
+        spec_file = Path(f"QuickPdfOcr-{cache_key}.spec")
+        workpath = os.environ.get("PYI_WORKPATH", f"build/pyi-{cache_key}")
+        # Only regenerate the spec when its inputs changed - otherwise PyInstaller
+        # goes straight to analysis with the cached spec
+        if spec_is_stale(spec_file, profile, poppler_path, tesseract_path):
+            generate_spec(spec_file, system, poppler_path, tesseract_path, profile)
         else:
-            print("\nALL DEPENDENCIES BUNDLED!")
-            print("   Users can run the executable without any additional installations!")
+            print(f"\nReusing up-to-date spec file: {spec_file}")
         
-        print("\n" + "="*60)
-        print("The executable is completely standalone and does NOT require")
-        print("Python to be installed on the target system!")
-        print("="*60)
+        # Analysis reads the staging directory as soon as PyInstaller starts
+        if staging:
+            staged = staging.result()
+            print(f"\nStaged {len(staged)} Poppler tool(s) in: {POPPLER_STAGE_DIR}")
         
-    except subprocess.CalledProcessError as e:
-        print(f"\nBuild failed: {e}")
-        sys.exit(1)
+        # Hashed once the spec and the staged tools are final
+        tree_hash = source_tree_hash(cache_key, spec_file)
+        restore_build_cache(workpath, tree_hash)
+    
+    # Run PyInstaller
+    try:
+        run_pyinstaller(spec_file, workpath)
+    except SystemExit as e:
+        # A falsy code (0 or None) is PyInstaller finishing normally - only a
+        # real failure stops the build here
+        if e.code:
+            print(f"\nBuild failed: {e}")
+            sys.exit(e.code)
+    
+    save_build_cache(workpath, tree_hash)
+    
+    print("\n" + "="*60)
+    print("BUILD SUCCESSFUL!")
+    print("="*60)
+    exe_name = "QuickPdfOcr.exe" if system == "Windows" else "QuickPdfOcr"
+    print(f"\nExecutable location: dist/QuickPdfOcr/{exe_name}")
+    if system == "Darwin":
+        print("App bundle location: dist/QuickPdfOcr.app")
+    
+    print("\nBUNDLED COMPONENTS:")
+    print("  [OK] Python interpreter (users do NOT need Python installed)")
+    print("  [OK] All Python packages (PySide6, pytesseract, pdf2image, Pillow, PyPDF2)")
+    
+    if poppler_path:
+        print("  [OK] Poppler binaries (users do NOT need to install Poppler)")
+    else:
+        print("  [WARN] Poppler NOT bundled (users must install Poppler separately)")
+    
+    if tesseract_path:
+        print("  [OK] Tesseract OCR (users do NOT need to install Tesseract)")
+    else:
+        print("  [WARN] Tesseract NOT bundled (users must install Tesseract separately)")
+    
+    if not poppler_path or not tesseract_path:
+        print("\n[WARNING] EXTERNAL DEPENDENCIES (must be installed separately):")
+        if not poppler_path:
+            print("  - Poppler (for PDF processing)")
+        if not tesseract_path:
+            print("  - Tesseract OCR (required for text recognition)")
+        print("\nInstallation instructions:")
+        print("    - macOS: brew install tesseract" if not tesseract_path else "")
+        if not poppler_path:
+            print("    - macOS: brew install poppler")
+        print("    - Linux: sudo apt-get install tesseract-ocr" if not tesseract_path else "")
+        if not poppler_path:
+            print("    - Linux: sudo apt-get install poppler-utils")
+        print("    - Windows: https://github.com/UB-Mannheim/tesseract/wiki" if not tesseract_path else "")
+        if not poppler_path:
+            print("    - Windows: https://github.com/oschwartz10612/poppler-windows/releases/")
+    else:
+        print("\nALL DEPENDENCIES BUNDLED!")
+        print("   Users can run the executable without any additional installations!")
+    
+    print("\n" + "="*60)
+    print("The executable is completely standalone and does NOT require")
+    print("Python to be installed on the target system!")
+    print("="*60)
 
 
 if __name__ == "__main__":
-    build_executable()
+    parser = argparse.ArgumentParser(description="Build the standalone QuickPdfOcr executable")
+    parser.add_argument(
+        "--profile",
+        choices=sorted(BUILD_PROFILES),
+        default=DEFAULT_PROFILE,
+        help=f"Build profile (default: {DEFAULT_PROFILE})",
+    )
+    args = parser.parse_args()
+    build_executable(args.profile)
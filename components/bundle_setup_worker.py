@@ -0,0 +1,23 @@
+"""
+Bundle Setup Worker - Background thread for locating bundled Poppler and Tesseract
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+
+class BundleSetupWorker(QObject):
+    """Worker class to set up the bundled binaries in a background thread"""
+    
+    progress = Signal(str)  # Progress message
+    finished = Signal()     # Setup completed
+    
+    def run(self):
+        """Execute the bundled binary setup"""
+        # Imported here so loading the module also happens off the GUI thread
+        from components.poppler_utils import setup_bundled_binaries
+        
+        try:
+            setup_bundled_binaries(progress_callback=self.progress.emit)
+        finally:
+            # The app must start even if setup failed - OCR reports missing tools itself
+            self.finished.emit()
@@ -1,49 +1,83 @@
 """
-OCR Worker - Background thread for PDF OCR processing
+OCR Worker - Background task for PDF OCR processing
 """
 
-from PySide6.QtCore import QObject, Signal
-from components.pdf_ocr import PdfOcrProcessor
+from functools import lru_cache
 
+from PySide6.QtCore import QObject, QRunnable, Signal
 
-class OCRWorker(QObject):
-    """Worker class to run OCR in a background thread"""
+
+@lru_cache(maxsize=4)
+def _get_processor(lang: str):
+    """
+    Get the shared OCR processor for a language
+    
+    A processor only holds its language - process() keeps everything about the
+    PDF (path, DPI, pages) in local variables - so one instance per language is
+    reused by every worker in the session.
+    
+    Args:
+        lang (str): Tesseract language code
+    
+    Returns:
+        PdfOcrProcessor: Processor for the language
+    """
+    # Imported on first use so pdf2image/pytesseract/PyPDF2 stay off the startup path
+    from components.pdf_ocr import PdfOcrProcessor
+    return PdfOcrProcessor(lang=lang)
+
+
+class OCRWorkerSignals(QObject):
+    """Signals of an OCRWorker (a QRunnable can't have signals itself)"""
     
-    progress = Signal(str)  # Progress message
-    finished = Signal(str)  # Completed with extracted text
-    error = Signal(str)     # Error message
+    progress = Signal(str)    # Progress message
+    page_ready = Signal(str)  # Text of the next page, in page order
+    finished = Signal(str)    # Completed with extracted text
+    error = Signal(str)       # Error message
+
+
+class OCRWorker(QRunnable):
+    """Task that runs OCR on one PDF in a QThreadPool thread"""
     
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, use_text_layer: bool = True):
         super().__init__()
         self.pdf_path = pdf_path
+        # False forces OCR even if the PDF already contains text
+        self.use_text_layer = use_text_layer
+        # Lives on the creating (GUI) thread, so connected slots of GUI objects
+        # are called there
+        self.signals = OCRWorkerSignals()
     
     def run(self):
         """Execute OCR processing"""
         try:
-            # Create OCR processor
-            processor = PdfOcrProcessor(lang='eng')
+            # Get the (cached) OCR processor
+            processor = _get_processor('eng')
             
-            # Run OCR with progress callback
+            # Run OCR with progress callback - every message is emitted; the main
+            # window coalesces them to one label update per repaint interval
             text = processor.process(
                 self.pdf_path, 
                 output_file=None,
-                progress_callback=self.progress.emit
+                progress_callback=self.signals.progress.emit,
+                use_text_layer=self.use_text_layer,
+                page_callback=self.signals.page_ready.emit
             )
             
             # Check if we got any text
             if not text or text.strip() == "":
-                self.error.emit("No text could be extracted from the PDF")
+                self.signals.error.emit("No text could be extracted from the PDF")
                 return
             
             # Success!
-            self.finished.emit(text)
+            self.signals.finished.emit(text)
             
         except FileNotFoundError as e:
-            self.error.emit(f"File not found: {str(e)}")
+            self.signals.error.emit(f"File not found: {str(e)}")
         except ValueError as e:
-            self.error.emit(f"Invalid file: {str(e)}")
+            self.signals.error.emit(f"Invalid file: {str(e)}")
         except Exception as e:
             # Provide more detailed error information
             import traceback
             error_details = traceback.format_exc()
-            self.error.emit(f"OCR failed: {str(e)}\n\nDetails:\n{error_details}")
+            self.signals.error.emit(f"OCR failed: {str(e)}\n\nDetails:\n{error_details}")
@@ -2,16 +2,21 @@
 """
 PDF OCR Component - Extract text from PDF files using OCR
 Uses pytesseract (Tesseract OCR) - the most popular open-source OCR engine
+If tesserocr is installed, Tesseract runs in-process instead (no process per page)
 """
 
 import os
-import platform
+import re
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, TextIO
 
 try:
-    from pdf2image import convert_from_path
+    from pdf2image import convert_from_path, pdfinfo_from_path
     from pdf2image.exceptions import PDFInfoNotInstalledError
     import pytesseract
     from PIL import Image
@@ -25,6 +30,151 @@ except ImportError as e:
     print("  Linux: sudo apt-get install tesseract-ocr poppler-utils")
     sys.exit(1)
 
+# Tesseract's own OpenMP threading scales poorly - OCR several single-threaded
+# pages at once instead (an explicit OMP_THREAD_LIMIT is respected). Set before
+# tesserocr is imported, as OpenMP reads it when libtesseract is loaded.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+try:
+    # Optional - keeps Tesseract loaded in-process instead of starting a
+    # tesseract process (and reloading the language data) for every page
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+
+# Pages OCRed at the same time. Every page runs in its own tesseract process or
+# engine (limited to one OpenMP thread), so one page per core keeps all cores busy.
+OCR_WORKERS = os.cpu_count() or 1
+# pdftoppm processes rendering page ranges at the same time (one core left for the UI)
+RENDER_THREADS = max(1, (os.cpu_count() or 2) - 1)
+# Pages smaller than this (in inches, e.g. receipts) are OCRed several at a time
+# by one tesseract process, to share the fixed cost of starting tesseract
+SMALL_PAGE_INCHES = 6
+# Maximum small pages OCRed by one tesseract process
+SMALL_PAGE_BATCH = 4
+# Average characters per page above which an existing text layer is used instead of OCR
+TEXT_LAYER_MIN_CHARS = 100
+# sys.platform is fixed at interpreter build time - no system call needed
+_IS_WINDOWS = sys.platform.startswith('win')
+
+
+def _choose_dpi(max_dimension: float) -> tuple:
+    """
+    Choose the rendering DPI for a page size
+    
+    Small pages (like receipts) need higher DPI, standard letter/A4 can use
+    medium DPI and large pages can use lower DPI.
+    
+    Args:
+        max_dimension (float): Longer side of the page in inches
+    
+    Returns:
+        tuple: (dpi, reason) with the DPI and a description of the page size
+    """
+    if max_dimension < 6:  # Small document (receipt, card, etc.)
+        return 400, "small document detected"
+    if max_dimension < 10:  # Standard size (letter, A4)
+        return 300, "standard document size"
+    if max_dimension < 14:  # Legal, A3
+        return 250, "large document detected"
+    return 200, "very large document detected"  # Very large documents
+
+
+@lru_cache(maxsize=16)
+def _first_page_size(pdf_path: str, mtime_ns: int) -> Optional[tuple]:
+    """
+    Get the size of the first page of a PDF
+    
+    Cached, so processing the same unchanged file again doesn't start
+    pdfinfo again (mtime_ns is part of the key so edited files are re-read).
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        mtime_ns (int): Modification time of the file
+    
+    Returns:
+        tuple or None: (width, height) in points, or None if pdfinfo doesn't report a size
+    """
+    # e.g. "Page size: 612 x 792 pts (letter)"
+    page_size = pdfinfo_from_path(pdf_path).get("Page size", "")
+    match = re.match(r"([\d.]+) x ([\d.]+) pts", page_size)
+    if match:
+        return float(match.group(1)), float(match.group(2))
+    return None
+
+
+@lru_cache(maxsize=16)
+def _format_tessdata_arg(path: str, windows: bool = _IS_WINDOWS) -> str:
+    """
+    Format the --tessdata-dir option for a tessdata directory
+    
+    Tesseract on Windows handles forward slashes better, so backslashes are
+    converted there. Elsewhere a backslash is a legal filename character and
+    the path is left as it is. Paths with spaces are quoted.
+    
+    Cached, as the tessdata directory rarely changes within a process.
+    
+    Args:
+        path (str): Absolute tessdata directory
+        windows (bool): Format for Windows (defaults to the current platform)
+    
+    Returns:
+        str: Option to pass to Tesseract as config
+    """
+    if windows:
+        path = path.replace('\\', '/')
+    if ' ' in path:
+        path = f'"{path}"'
+    return f'--tessdata-dir {path}'
+
+
+class _TesserocrEngines:
+    """One tesserocr engine per OCR thread, reused for every page that thread OCRs"""
+    
+    def __init__(self, lang: str, tessdata_dir: Optional[str] = None):
+        """
+        Args:
+            lang (str): Tesseract language string
+            tessdata_dir (str, optional): Directory with the language data (tesserocr's default if None)
+        """
+        self.lang = lang
+        self.tessdata_dir = tessdata_dir
+        self._local = threading.local()
+        self._engines = []
+        self._lock = threading.Lock()
+    
+    def get(self):
+        """
+        Get the calling thread's engine, loading it on first use
+        
+        Returns:
+            tesserocr.PyTessBaseAPI: Initialized engine (engines aren't thread-safe, so never share it)
+        
+        Raises:
+            RuntimeError: If Tesseract can't load the language data
+        """
+        api = getattr(self._local, 'api', None)
+        if api is None:
+            kwargs = {'lang': self.lang}
+            if self.tessdata_dir:
+                kwargs['path'] = self.tessdata_dir
+            try:
+                api = tesserocr.PyTessBaseAPI(**kwargs)
+            except RuntimeError as e:
+                raise RuntimeError(f"Tesseract could not load language data for '{self.lang}': {e}")
+            self._local.api = api
+            with self._lock:
+                self._engines.append(api)
+        return api
+    
+    def close(self):
+        """Release all engines"""
+        with self._lock:
+            for api in self._engines:
+                api.End()
+            self._engines.clear()
+
 
 class PdfOcrProcessor:
     """PDF OCR Processor Component"""
@@ -37,12 +187,14 @@ class PdfOcrProcessor:
             lang (str): Tesseract language code (default: 'eng' for English)
         """
         self.lang = lang
-        self.dpi = None
     
     def detect_optimal_dpi(self, pdf_path: Path) -> int:
         """
         Auto-detect optimal DPI based on PDF characteristics
         
+        The first page's size comes from Poppler's pdfinfo, which only reads
+        that page - the cost doesn't grow with the number of pages.
+        
         Args:
             pdf_path (Path): Path to the PDF file
         
@@ -50,49 +202,19 @@ class PdfOcrProcessor:
             int: Recommended DPI value
         """
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                # Get first page to analyze
-                if len(pdf_reader.pages) == 0:
-                    return 300  # Default fallback
+            page_size = _first_page_size(str(pdf_path), os.stat(pdf_path).st_mtime_ns)
+            
+            if page_size:
+                # Convert to inches (1 point = 1/72 inch)
+                width_inches = page_size[0] / 72
+                height_inches = page_size[1] / 72
                 
-                page = pdf_reader.pages[0]
-                
-                # Get page dimensions (in points, 1 point = 1/72 inch)
-                if '/MediaBox' in page:
-                    media_box = page.mediabox
-                    width_points = float(media_box.width)
-                    height_points = float(media_box.height)
-                    
-                    # Convert to inches
-                    width_inches = width_points / 72
-                    height_inches = height_points / 72
-                    
-                    # Determine DPI based on page size
-                    # Small pages (like receipts) need higher DPI
-                    # Standard letter/A4 can use medium DPI
-                    # Large pages can use lower DPI
-                    
-                    max_dimension = max(width_inches, height_inches)
-                    
-                    if max_dimension < 6:  # Small document (receipt, card, etc.)
-                        dpi = 400
-                        reason = "small document detected"
-                    elif max_dimension < 10:  # Standard size (letter, A4)
-                        dpi = 300
-                        reason = "standard document size"
-                    elif max_dimension < 14:  # Legal, A3
-                        dpi = 250
-                        reason = "large document detected"
-                    else:  # Very large documents
-                        dpi = 200
-                        reason = "very large document detected"
-                    
-                    print(f"Auto-detected DPI: {dpi} ({reason})")
-                    print(f"  Page size: {width_inches:.1f}\" × {height_inches:.1f}\"")
-                    return dpi
+                dpi, reason = _choose_dpi(max(width_inches, height_inches))
                 
+                print(f"Auto-detected DPI: {dpi} ({reason})")
+                print(f"  Page size: {width_inches:.1f}\" × {height_inches:.1f}\"")
+                return dpi
+            
         except Exception as e:
             print(f"Warning: Could not auto-detect DPI ({e}), using default 300")
         
@@ -103,7 +225,9 @@ class PdfOcrProcessor:
         pdf_path: str, 
         output_file: Optional[str] = None, 
         dpi: Optional[int] = None,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        use_text_layer: bool = True,
+        page_callback: Optional[Callable[[str], None]] = None
     ) -> str:
         """
         Extract text from PDF using OCR
@@ -113,6 +237,9 @@ class PdfOcrProcessor:
             output_file (str, optional): Path to save extracted text. If None, doesn't save to file
             dpi (int, optional): Resolution for PDF to image conversion. If None, auto-detects optimal DPI
             progress_callback (callable, optional): Function to call with progress updates
+            use_text_layer (bool): Return the PDF's own text instead of running OCR if every page has one
+            page_callback (callable, optional): Function to call with each page's text as soon as it and
+                every page before it are done - the chunks add up to the returned text
         
         Returns:
             str: Extracted text
@@ -132,78 +259,390 @@ class PdfOcrProcessor:
         
         self._log(f"Processing PDF: {pdf_path.name}", progress_callback)
         
-        # Auto-detect DPI if not specified
-        if dpi is None:
-            dpi = self.detect_optimal_dpi(pdf_path)
+        # Pages are written to the output file as they are finished. The file
+        # only gets its final name once the whole PDF is done, so a failed run
+        # never leaves a truncated result behind.
+        output = None
+        if output_file:
+            output_path = Path(output_file)
+            partial_path = output_path.with_name(output_path.name + ".partial")
+            output = open(partial_path, 'w', encoding='utf-8')
+        
+        try:
+            all_text = None
+            if use_text_layer:
+                all_text = self._extract_text_layer(pdf_path)
+                if all_text is not None:
+                    self._log(f"PDF already contains text on all {len(all_text)} page(s), skipping OCR", progress_callback)
+                    if output is not None:
+                        output.write("\n".join(all_text))
+                    if page_callback is not None:
+                        for i, page_text in enumerate(all_text):
+                            page_callback(page_text if i == 0 else "\n" + page_text)
+                else:
+                    self._log("PDF has no usable text layer, running OCR", progress_callback)
+            else:
+                self._log("Ignoring any text layer (forced OCR)", progress_callback)
+            
+            if all_text is None:
+                # Auto-detect DPI if not specified
+                if dpi is None:
+                    dpi = self.detect_optimal_dpi(pdf_path)
+                
+                self._log(f"Converting PDF to images (DPI: {dpi})...", progress_callback)
+                
+                all_text = self._render_and_ocr(pdf_path, dpi, progress_callback, output, page_callback)
+        except BaseException:
+            if output is not None:
+                output.close()
+                partial_path.unlink(missing_ok=True)
+            raise
+        
+        # Save results if output file specified
+        if output is not None:
+            output.close()
+            os.replace(partial_path, output_path)
+            self._log(f"Text extracted and saved to: {output_path}", progress_callback)
         
-        self.dpi = dpi
-        self._log(f"Converting PDF to images (DPI: {dpi})...", progress_callback)
+        # Combine all text
+        return "\n".join(all_text)
+    
+    def _extract_text_layer(self, pdf_path: Path) -> Optional[list]:
+        """
+        Get the text of a PDF that already has a text layer (digitally created or OCRed before)
         
-        # Convert PDF to images
+        Args:
+            pdf_path (Path): Path to the PDF file
+        
+        Returns:
+            list or None: Text of each page with its page header, or None if the PDF needs OCR
+        """
+        texts = []
         try:
-            images = convert_from_path(pdf_path, dpi=dpi)
+            for page in PyPDF2.PdfReader(str(pdf_path)).pages:
+                text = (page.extract_text() or "").strip()
+                if not text:
+                    # Scanned page - stops after the first page for fully scanned PDFs
+                    return None
+                texts.append(text)
         except Exception as e:
-            error_msg = str(e).lower()
-            if "poppler" in error_msg or "pdftoppm" in error_msg or "pdfinfo" in error_msg:
-                raise RuntimeError(
-                    f"Poppler utilities not found. Please ensure Poppler is installed.\n"
-                    f"Original error: {e}"
-                )
-            else:
-                raise RuntimeError(f"Failed to convert PDF to images: {e}")
+            print(f"Warning: Could not read text layer ({e}), running OCR")
+            return None
         
-        self._log(f"Found {len(images)} page(s)", progress_callback)
+        if not texts or sum(len(text) for text in texts) / len(texts) < TEXT_LAYER_MIN_CHARS:
+            return None
         
-        # Extract text from each page
-        all_text = []
+        return [f"--- Page {i} ---\n{text}\n" for i, text in enumerate(texts, 1)]
+    
+    def _render_and_ocr(
+        self,
+        pdf_path: Path,
+        dpi: int,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        output: Optional[TextIO] = None,
+        page_callback: Optional[Callable[[str], None]] = None
+    ) -> list:
+        """
+        Render the PDF pages and run OCR on them
+        
+        Args:
+            pdf_path (Path): Path to the PDF file
+            dpi (int): Resolution for PDF to image conversion
+            progress_callback (callable, optional): Function to call with progress updates
+            output (file, optional): Text file to write each page to as soon as it's done
+            page_callback (callable, optional): Function to call with each page's text as soon as it's done
         
-        # Get tessdata configuration if running from bundle
-        tessdata_config = self._get_tessdata_config()
+        Returns:
+            list: Text of each page, prefixed with its page header
         
-        for i, image in enumerate(images, 1):
-            self._log(f"Processing page {i}/{len(images)}...", progress_callback)
+        Raises:
+            RuntimeError: If PDF conversion or OCR fails
+        """
+        # Resolve the bundled language data once, before any page is rendered
+        tessdata_dir = self._get_tessdata_dir()
+        
+        # Pages are rendered into a temporary folder and handed to Tesseract as
+        # files, so no page is ever held in memory here - peak memory doesn't
+        # grow with the page count
+        with tempfile.TemporaryDirectory(prefix="quickpdfocr_", ignore_cleanup_errors=True) as output_folder:
+            # Convert PDF to images - pdftoppm renders page ranges in parallel.
+            # Grayscale PGM is a third of the size of RGB and Tesseract converts
+            # to grayscale before binarizing anyway, so no OCR quality is lost
             try:
-                # Perform OCR on the image
-                # Pass tessdata config if available to ensure Tesseract finds language files
-                if tessdata_config:
-                    text = pytesseract.image_to_string(image, lang=self.lang, config=tessdata_config)
-                else:
-                    text = pytesseract.image_to_string(image, lang=self.lang)
-                all_text.append(f"--- Page {i} ---\n{text}\n")
+                page_paths = convert_from_path(
+                    pdf_path,
+                    dpi=dpi,
+                    output_folder=output_folder,
+                    fmt='ppm',
+                    grayscale=True,
+                    thread_count=RENDER_THREADS,
+                    paths_only=True
+                )
             except Exception as e:
                 error_msg = str(e).lower()
-                if "tesseract" in error_msg or "not found" in error_msg or "traineddata" in error_msg:
-                    # Critical error - Tesseract not available or misconfigured
-                    tessdata_prefix = os.environ.get('TESSDATA_PREFIX', 'Not set')
-                    tessdata_dir = os.environ.get('TESSDATA_DIR', 'Not set')
+                if "poppler" in error_msg or "pdftoppm" in error_msg or "pdfinfo" in error_msg:
                     raise RuntimeError(
-                        f"Tesseract OCR not found or not configured properly.\n"
-                        f"TESSDATA_PREFIX: {tessdata_prefix}\n"
-                        f"TESSDATA_DIR: {tessdata_dir}\n"
+                        f"Poppler utilities not found. Please ensure Poppler is installed.\n"
                         f"Original error: {e}"
                     )
                 else:
-                    # Page-specific error - continue with other pages
-                    print(f"Warning: Failed to process page {i}: {e}")
-                    all_text.append(f"--- Page {i} ---\n[OCR Error: {e}]\n")
+                    raise RuntimeError(f"Failed to convert PDF to images: {e}")
+            
+            self._log(f"Found {len(page_paths)} page(s)", progress_callback)
+            
+            return self._ocr_pages(page_paths, tessdata_dir, progress_callback, dpi, output, page_callback)
+    
+    def _ocr_pages(
+        self,
+        page_paths: list,
+        tessdata_dir: Optional[str],
+        progress_callback: Optional[Callable[[str], None]] = None,
+        dpi: Optional[int] = None,
+        output: Optional[TextIO] = None,
+        page_callback: Optional[Callable[[str], None]] = None
+    ) -> list:
+        """
+        Run OCR on the rendered pages in parallel
         
-        # Combine all text
-        final_text = "\n".join(all_text)
+        Args:
+            page_paths (list): Paths of the page images in page order
+            tessdata_dir (str, optional): Directory from _get_tessdata_dir()
+            progress_callback (callable, optional): Function to call with progress updates
+            dpi (int, optional): Resolution the pages were rendered at (enables batching small pages)
+            output (file, optional): Text file to write each page to as soon as it's done
+            page_callback (callable, optional): Function to call with each page's text as soon as it's done
         
-        # Save results if output file specified
-        if output_file:
-            output_path = Path(output_file)
-            output_path.write_text(final_text, encoding='utf-8')
-            self._log(f"Text extracted and saved to: {output_path}", progress_callback)
+        Returns:
+            list: Text of each page, prefixed with its page header
+        
+        Raises:
+            RuntimeError: If Tesseract is not available or misconfigured
+        """
+        # Extract text from each page
+        all_text = []
+        
+        # Built once here - the per-page calls only pass it on
+        tessdata_config = _format_tessdata_arg(tessdata_dir) if tessdata_dir else None
+        
+        # Language data is loaded once per thread rather than once per page
+        engines = _TesserocrEngines(self.lang, tessdata_dir) if tesserocr else None
+        
+        # In-process engines have no per-call startup cost to share
+        if engines is None and dpi:
+            batches = self._batch_small_pages(page_paths, dpi)
+        else:
+            batches = [[path] for path in page_paths]
+        
+        workers = min(OCR_WORKERS, len(batches) or 1)
+        
+        try:
+            # Threads are enough to OCR pages in parallel - the GIL is released while
+            # waiting for the tesseract subprocess or while tesserocr recognizes
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Page numbers covered by each batch's future
+                page_numbers = {}
+                first_page = 1
+                for batch in batches:
+                    future = executor.submit(self._ocr_batch, batch, tessdata_config, engines)
+                    page_numbers[future] = range(first_page, first_page + len(batch))
+                    first_page += len(batch)
+                
+                # Pages are reported as soon as they finish, even if an earlier
+                # (harder) page is still being OCRed, and are added to the result
+                # in page order once every page before them is done
+                finished = {}
+                next_page = 1
+                for future in as_completed(page_numbers):
+                    pages = page_numbers[future]
+                    try:
+                        texts = future.result()
+                        page_texts = [f"--- Page {i} ---\n{text}\n" for i, text in zip(pages, texts)]
+                    except Exception as e:
+                        error_msg = str(e).lower()
+                        if "tesseract" in error_msg or "not found" in error_msg or "traineddata" in error_msg:
+                            # Critical error - don't OCR the remaining pages
+                            for pending in page_numbers:
+                                pending.cancel()
+                            # Tesseract not available or misconfigured
+                            tessdata_prefix = os.environ.get('TESSDATA_PREFIX', 'Not set')
+                            tessdata_dir_env = os.environ.get('TESSDATA_DIR', 'Not set')
+                            raise RuntimeError(
+                                f"Tesseract OCR not found or not configured properly.\n"
+                                f"TESSDATA_PREFIX: {tessdata_prefix}\n"
+                                f"TESSDATA_DIR: {tessdata_dir_env}\n"
+                                f"Original error: {e}"
+                            )
+                        else:
+                            # Page-specific error - continue with other pages
+                            for i in pages:
+                                print(f"Warning: Failed to process page {i}: {e}")
+                            page_texts = [f"--- Page {i} ---\n[OCR Error: {e}]\n" for i in pages]
+                    
+                    for i, page_text in zip(pages, page_texts):
+                        finished[i] = page_text
+                        self._log(f"Finished page {i} ({len(finished)}/{len(page_paths)})", progress_callback)
+                    
+                    while next_page in finished:
+                        page_text = finished[next_page]
+                        all_text.append(page_text)
+                        # Same layout as joining all pages with newlines at the end
+                        chunk = page_text if next_page == 1 else "\n" + page_text
+                        if output is not None:
+                            output.write(chunk)
+                            output.flush()
+                        if page_callback is not None:
+                            page_callback(chunk)
+                        next_page += 1
+        finally:
+            # The executor has waited for its threads, so no engine is still in use
+            if engines is not None:
+                engines.close()
+        
+        return all_text
+    
+    def _batch_small_pages(self, page_paths: list, dpi: int) -> list:
+        """
+        Group consecutive small pages into batches to be OCRed by one tesseract process
+        
+        Args:
+            page_paths (list): Paths of the page images in page order
+            dpi (int): Resolution the pages were rendered at
+        
+        Returns:
+            list: Lists of page paths in page order (a single path for normal pages)
+        """
+        # Never batch so much that some OCR workers are left idle
+        batch_size = max(1, min(SMALL_PAGE_BATCH, len(page_paths) // OCR_WORKERS))
+        max_pixels = SMALL_PAGE_INCHES * dpi
+        
+        batches = []
+        current = []
+        for path in page_paths:
+            # Only the image header is read here
+            with Image.open(path) as image:
+                is_small = max(image.size) < max_pixels
+            
+            if not is_small:
+                if current:
+                    batches.append(current)
+                    current = []
+                batches.append([path])
+                continue
+            
+            current.append(path)
+            if len(current) == batch_size:
+                batches.append(current)
+                current = []
+        
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _ocr_batch(
+        self,
+        page_paths: list,
+        tessdata_config: Optional[str],
+        engines: Optional[_TesserocrEngines] = None
+    ) -> list:
+        """
+        Run OCR on a batch of pages from _batch_small_pages() (called from the worker threads)
+        
+        Args:
+            page_paths (list): Paths of the page images in page order
+            tessdata_config (str, optional): Configuration from _format_tessdata_arg()
+            engines (_TesserocrEngines, optional): In-process engines to use instead of pytesseract
+        
+        Returns:
+            list: Text recognized on each page
+        """
+        if len(page_paths) == 1:
+            return [self._ocr_page(page_paths[0], tessdata_config, engines)]
+        return self._ocr_page_list(page_paths, tessdata_config)
+    
+    def _ocr_page_list(self, page_paths: list, tessdata_config: Optional[str]) -> list:
+        """
+        Run OCR on several pages with a single tesseract process
+        
+        Tesseract is given a text file listing the page images and recognizes
+        each one as a page of its own, so every page gets exactly the text
+        image_to_string() returns for it alone. Tesseract ends each page's text
+        with a form feed, which splits the output back into pages.
+        
+        Args:
+            page_paths (list): Paths of the page images in page order
+            tessdata_config (str, optional): Configuration from _format_tessdata_arg()
+        
+        Returns:
+            list: Text recognized on each page
+        """
+        list_path = f"{page_paths[0]}.list.txt"
+        fallback = False
+        try:
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write("\n".join(page_paths) + "\n")
+            if tessdata_config:
+                text = pytesseract.image_to_string(list_path, lang=self.lang, config=tessdata_config)
+            else:
+                text = pytesseract.image_to_string(list_path, lang=self.lang)
+            texts = [page + "\f" for page in text.split("\f")[:-1]]
+            fallback = len(texts) != len(page_paths)
+        finally:
+            # The batch's pages are released as soon as tesseract is done with
+            # them, even if it failed, instead of staying on disk until the
+            # whole PDF is finished
+            for path in [list_path] if fallback else [list_path, *page_paths]:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
         
-        return final_text
+        if fallback:
+            # Output that doesn't split into one text per page - OCR the pages one by one
+            return [self._ocr_page(path, tessdata_config) for path in page_paths]
+        return texts
     
-    def _get_tessdata_config(self) -> Optional[str]:
+    def _ocr_page(
+        self,
+        page_path: str,
+        tessdata_config: Optional[str],
+        engines: Optional[_TesserocrEngines] = None
+    ) -> str:
         """
-        Get Tesseract configuration string for tessdata directory if running from bundle
+        Run OCR on a single rendered page (called from the worker threads)
+        
+        The page file is passed to Tesseract as-is (it reads PGM directly, so
+        the page is never decoded and re-encoded here) and deleted afterwards
+        to free the disk space early.
+        
+        Args:
+            page_path (str): Path of the rendered page image
+            tessdata_config (str, optional): Configuration from _format_tessdata_arg()
+            engines (_TesserocrEngines, optional): In-process engines to use instead of pytesseract
         
         Returns:
-            str or None: Configuration string to pass to pytesseract, or None if not needed
+            str: Text recognized on the page
+        """
+        try:
+            if engines is not None:
+                api = engines.get()
+                api.SetImageFile(page_path)
+                return api.GetUTF8Text()
+            # Pass tessdata config if available to ensure Tesseract finds language files
+            if tessdata_config:
+                return pytesseract.image_to_string(page_path, lang=self.lang, config=tessdata_config)
+            return pytesseract.image_to_string(page_path, lang=self.lang)
+        finally:
+            try:
+                os.unlink(page_path)
+            except OSError:
+                pass
+    
+    def _get_tessdata_dir(self) -> Optional[str]:
+        """
+        Get the tessdata directory to use if running from bundle
+        
+        Returns:
+            str or None: Absolute tessdata directory, or None if Tesseract's default should be used
         """
         # Only needed when running from PyInstaller bundle
         if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
@@ -211,25 +650,7 @@ class PdfOcrProcessor:
             tessdata_path = bundle_dir / "tesseract" / "tessdata"
             
             if tessdata_path.exists():
-                # Use --tessdata-dir to explicitly tell Tesseract where to find language data
-                # This is more reliable than relying on TESSDATA_PREFIX alone
-                tessdata_str = os.path.abspath(str(tessdata_path))
-                
-                # On Windows, use forward slashes which Tesseract handles better
-                # and add double quotes if the path contains spaces
-                if platform.system() == "Windows":
-                    # Convert backslashes to forward slashes for better compatibility
-                    tessdata_str = tessdata_str.replace('\\', '/')
-                    # Add double quotes if path contains spaces
-                    if ' ' in tessdata_str:
-                        tessdata_str = f'"{tessdata_str}"'
-                else:
-                    # On Unix-like systems, add quotes if path contains spaces
-                    if ' ' in tessdata_str:
-                        # Use double quotes for better compatibility
-                        tessdata_str = f'"{tessdata_str}"'
-                
-                return f'--tessdata-dir {tessdata_str}'
+                return os.path.abspath(str(tessdata_path))
         
         return None
     
@@ -248,7 +669,7 @@ class PdfOcrProcessor:
 
 
 # Backward compatibility function
-def ocr_pdf(pdf_path, output_file=None, dpi=None, lang='eng'):
+def ocr_pdf(pdf_path, output_file=None, dpi=None, lang='eng', use_text_layer=True):
     """
     Legacy function for backward compatibility
     Extract text from PDF using OCR
@@ -258,12 +679,13 @@ def ocr_pdf(pdf_path, output_file=None, dpi=None, lang='eng'):
         output_file (str, optional): Path to save extracted text. If None, prints to stdout
         dpi (int, optional): Resolution for PDF to image conversion. If None, auto-detects optimal DPI
         lang (str): Tesseract language code (default: 'eng' for English)
+        use_text_layer (bool): Use the PDF's own text instead of OCR if every page has one
     
     Returns:
         str: Extracted text
     """
     processor = PdfOcrProcessor(lang=lang)
-    final_text = processor.process(pdf_path, output_file=output_file, dpi=dpi)
+    final_text = processor.process(pdf_path, output_file=output_file, dpi=dpi, use_text_layer=use_text_layer)
     
     if not output_file:
         print("\n" + "="*60)
@@ -277,7 +699,7 @@ def ocr_pdf(pdf_path, output_file=None, dpi=None, lang='eng'):
 def main():
     """Main entry point for command-line usage"""
     if len(sys.argv) < 2:
-        print("Usage: python pdf_ocr.py <pdf_file> [output_file] [--dpi DPI] [--lang LANG]")
+        print("Usage: python pdf_ocr.py <pdf_file> [output_file] [--dpi DPI] [--lang LANG] [--force-ocr]")
         print("\nExamples:")
         print("  python pdf_ocr.py document.pdf                      # Auto-detect DPI")
         print("  python pdf_ocr.py document.pdf output.txt")
@@ -287,6 +709,7 @@ def main():
         print("  eng = English, fra = French, deu = German, spa = Spanish")
         print("  chi_sim = Chinese Simplified, jpn = Japanese")
         print("\nNote: DPI is auto-detected by default based on document size")
+        print("PDFs that already contain text are not OCRed unless --force-ocr is given")
         sys.exit(1)
     
     # Parse arguments
@@ -294,6 +717,7 @@ def main():
     output_file = None
     dpi = None  # Auto-detect by default
     lang = 'eng'
+    use_text_layer = True
     
     i = 2
     while i < len(sys.argv):
@@ -304,6 +728,9 @@ def main():
         elif arg == '--lang' and i + 1 < len(sys.argv):
             lang = sys.argv[i + 1]
             i += 2
+        elif arg == '--force-ocr':
+            use_text_layer = False
+            i += 1
         elif not arg.startswith('--'):
             output_file = arg
             i += 1
@@ -312,7 +739,7 @@ def main():
     
     # Run OCR
     try:
-        ocr_pdf(pdf_path, output_file, dpi=dpi, lang=lang)
+        ocr_pdf(pdf_path, output_file, dpi=dpi, lang=lang, use_text_layer=use_text_layer)
         print("\n✓ OCR completed successfully!")
     except Exception as e:
         print(f"\n✗ Error: {e}", file=sys.stderr)
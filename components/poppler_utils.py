@@ -5,16 +5,21 @@ This module helps pdf2image and pytesseract find binaries when bundled with PyIn
 """
 
 import os
-import platform
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# sys.platform is fixed at interpreter build time - no system call needed
+_IS_WINDOWS = sys.platform.startswith('win')
+# Print the bundle diagnostics (found/missing files, directory listings) at startup
+DEBUG = bool(os.environ.get('QUICKPDFOCR_DEBUG'))
 # Maximum number of items to display when listing directory contents for diagnostics
 MAX_DIAGNOSTIC_ITEMS = 20
 # Maximum number of language files to display individually
 MAX_LANGUAGE_FILES_TO_SHOW = 5
 
 
+@lru_cache(maxsize=1)
 def get_bundled_poppler_path():
     """
     Get the path to bundled Poppler binaries if running from PyInstaller bundle
@@ -35,6 +40,7 @@ def get_bundled_poppler_path():
     return None
 
 
+@lru_cache(maxsize=1)
 def get_bundled_tesseract_path():
     """
     Get the path to bundled Tesseract executable if running from PyInstaller bundle
@@ -48,10 +54,7 @@ def get_bundled_tesseract_path():
         bundle_dir = Path(sys._MEIPASS)
         
         # Check for Tesseract in different locations based on platform
-        import platform
-        system = platform.system()
-        
-        if system == "Windows":
+        if _IS_WINDOWS:
             tesseract_exe = bundle_dir / "tesseract" / "tesseract.exe"
         else:
             tesseract_exe = bundle_dir / "tesseract" / "bin" / "tesseract"
@@ -63,10 +66,28 @@ def get_bundled_tesseract_path():
     return None
 
 
+def _prepend_to_path(directories):
+    """
+    Put directories at the front of PATH with a single environment write
+    
+    Directories that are already on PATH are skipped, so the bundle setup can
+    add every bundled bin directory at once and later per-tool setup is a no-op.
+    
+    Args:
+        directories (list): Directories to add, in lookup order
+    """
+    current = os.environ.get('PATH', '')
+    entries = current.split(os.pathsep)
+    missing = [directory for directory in directories if directory not in entries]
+    if missing:
+        os.environ['PATH'] = os.pathsep.join(missing + ([current] if current else []))
+
+
+@lru_cache(maxsize=1)
 def setup_poppler_path():
     """
     Setup Poppler path for pdf2image to use bundled binaries
-    This should be called at application startup
+    This should be called at application startup (later calls do nothing)
     
     Returns:
         str or None: Path that was set up, or None if using system Poppler
@@ -75,19 +96,20 @@ def setup_poppler_path():
     
     if bundled_path:
         # Add bundled Poppler to PATH so pdf2image can find it
-        os.environ['PATH'] = bundled_path + os.pathsep + os.environ.get('PATH', '')
+        _prepend_to_path([bundled_path])
         print(f"Using bundled Poppler from: {bundled_path}")
         
-        # Verify critical executables exist
-        import platform
-        exe_ext = ".exe" if platform.system() == "Windows" else ""
-        critical_tools = ["pdftoppm", "pdfinfo"]
-        for tool in critical_tools:
-            tool_path = Path(bundled_path) / f"{tool}{exe_ext}"
-            if tool_path.exists():
-                print(f"  ✓ Found: {tool}{exe_ext}")
-            else:
-                print(f"  ✗ Missing: {tool}{exe_ext}")
+        if DEBUG:
+            # Verify critical executables exist
+            exe_ext = ".exe" if _IS_WINDOWS else ""
+            with os.scandir(bundled_path) as entries:
+                present = {entry.name for entry in entries}
+            critical_tools = ["pdftoppm", "pdfinfo"]
+            for tool in critical_tools:
+                if f"{tool}{exe_ext}" in present:
+                    print(f"  ✓ Found: {tool}{exe_ext}")
+                else:
+                    print(f"  ✗ Missing: {tool}{exe_ext}")
         
         return bundled_path
     else:
@@ -95,10 +117,32 @@ def setup_poppler_path():
         return None
 
 
+def _format_tessdata_env(tesseract_dir: str, tessdata_dir: str, windows: bool = _IS_WINDOWS):
+    """
+    Format the TESSDATA_PREFIX and TESSDATA_DIR values for a bundled tessdata folder
+    
+    On Windows backslashes are converted to forward slashes for better Tesseract
+    compatibility. TESSDATA_PREFIX gets exactly one trailing separator.
+    
+    Args:
+        tesseract_dir (str): Absolute directory that contains the tessdata folder
+        tessdata_dir (str): Absolute tessdata directory
+        windows (bool): Format for Windows (defaults to the current platform)
+    
+    Returns:
+        tuple: (TESSDATA_PREFIX, TESSDATA_DIR) values
+    """
+    if windows:
+        tesseract_dir = tesseract_dir.replace('\\', '/')
+        tessdata_dir = tessdata_dir.replace('\\', '/')
+    return tesseract_dir.rstrip('/\\') + '/', tessdata_dir
+
+
+@lru_cache(maxsize=1)
 def setup_tesseract_path():
     """
     Setup Tesseract path for pytesseract to use bundled binaries
-    This should be called at application startup
+    This should be called at application startup (later calls do nothing)
     
     Returns:
         str or None: Path that was set up, or None if using system Tesseract
@@ -111,34 +155,22 @@ def setup_tesseract_path():
             import pytesseract
             pytesseract.pytesseract.tesseract_cmd = bundled_path
             
-            # Verify tesseract executable exists
-            if Path(bundled_path).exists():
-                print(f"✓ Found Tesseract executable: {bundled_path}")
-            else:
-                print(f"✗ Tesseract executable not found: {bundled_path}")
-            
             # Set TESSDATA_PREFIX for bundled tessdata
             if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
                 bundle_dir = Path(sys._MEIPASS)
                 tesseract_dir = bundle_dir / "tesseract"
                 tessdata_path = tesseract_dir / "tessdata"
                 
-                print(f"  Checking for tessdata at: {tessdata_path}")
+                if DEBUG:
+                    print(f"  Checking for tessdata at: {tessdata_path}")
                 
-                if tessdata_path.exists() and tessdata_path.is_dir():
+                if tessdata_path.is_dir():
                     # TESSDATA_PREFIX must point to the directory that CONTAINS the tessdata folder
                     # For Tesseract to find tessdata/, TESSDATA_PREFIX should end with a path separator
-                    tessdata_prefix = os.path.abspath(str(tesseract_dir))
-                    tessdata_dir_abs = os.path.abspath(str(tessdata_path))
-                    
-                    # On Windows, convert to forward slashes for better Tesseract compatibility
-                    if platform.system() == "Windows":
-                        tessdata_prefix = tessdata_prefix.replace('\\', '/')
-                        tessdata_dir_abs = tessdata_dir_abs.replace('\\', '/')
-                    
-                    # Add trailing separator
-                    if not tessdata_prefix.endswith(('/', '\\')):
-                        tessdata_prefix += '/'
+                    tessdata_prefix, tessdata_dir_abs = _format_tessdata_env(
+                        os.path.abspath(str(tesseract_dir)),
+                        os.path.abspath(str(tessdata_path))
+                    )
                     
                     os.environ['TESSDATA_PREFIX'] = tessdata_prefix
                     
@@ -146,30 +178,36 @@ def setup_tesseract_path():
                     # Some Tesseract versions look for different variables
                     os.environ['TESSDATA_DIR'] = tessdata_dir_abs
                     
-                    # Count language files
-                    traineddata_files = list(tessdata_path.glob("*.traineddata"))
-                    print(f"  ✓ Found tessdata directory with {len(traineddata_files)} language file(s)")
-                    print(f"  ✓ TESSDATA_PREFIX set to: {tessdata_prefix}")
-                    print(f"  ✓ TESSDATA_DIR set to: {os.environ['TESSDATA_DIR']}")
-                    
-                    # List language files (limited to avoid excessive output)
-                    for lang_file in traineddata_files[:MAX_LANGUAGE_FILES_TO_SHOW]:
-                        print(f"    - {lang_file.name}")
-                    if len(traineddata_files) > MAX_LANGUAGE_FILES_TO_SHOW:
-                        print(f"    ... and {len(traineddata_files) - MAX_LANGUAGE_FILES_TO_SHOW} more")
+                    if DEBUG:
+                        # Count language files
+                        with os.scandir(tessdata_path) as entries:
+                            traineddata_files = sorted(
+                                entry.name for entry in entries
+                                if entry.name.endswith(".traineddata")
+                            )
+                        print(f"  ✓ Found tessdata directory with {len(traineddata_files)} language file(s)")
+                        print(f"  ✓ TESSDATA_PREFIX set to: {tessdata_prefix}")
+                        print(f"  ✓ TESSDATA_DIR set to: {os.environ['TESSDATA_DIR']}")
+                        
+                        # List language files (limited to avoid excessive output)
+                        for name in traineddata_files[:MAX_LANGUAGE_FILES_TO_SHOW]:
+                            print(f"    - {name}")
+                        if len(traineddata_files) > MAX_LANGUAGE_FILES_TO_SHOW:
+                            print(f"    ... and {len(traineddata_files) - MAX_LANGUAGE_FILES_TO_SHOW} more")
                 else:
+                    # Always reported - OCR can't work without language data
                     print(f"  ✗ tessdata directory not found at: {tessdata_path}")
-                    print(f"  Listing contents of bundle tesseract directory:")
-                    if tesseract_dir.exists():
-                        for item in sorted(tesseract_dir.iterdir())[:MAX_DIAGNOSTIC_ITEMS]:
-                            item_type = "DIR" if item.is_dir() else "FILE"
-                            print(f"    - [{item_type}] {item.name}")
-                    else:
-                        print(f"  ✗ Bundle tesseract directory not found!")
-                        print(f"  Listing contents of bundle root:")
-                        for item in sorted(bundle_dir.iterdir())[:MAX_DIAGNOSTIC_ITEMS]:
-                            item_type = "DIR" if item.is_dir() else "FILE"
-                            print(f"    - [{item_type}] {item.name}")
+                    if DEBUG:
+                        # List whichever of the tesseract directory and the bundle root exists
+                        listed_dir = tesseract_dir if tesseract_dir.is_dir() else bundle_dir
+                        if listed_dir is bundle_dir:
+                            print(f"  ✗ Bundle tesseract directory not found!")
+                        print(f"  Listing contents of {listed_dir}:")
+                        with os.scandir(listed_dir) as entries:
+                            items = sorted((entry.name, entry.is_dir()) for entry in entries)
+                        for name, is_dir in items[:MAX_DIAGNOSTIC_ITEMS]:
+                            item_type = "DIR" if is_dir else "FILE"
+                            print(f"    - [{item_type}] {name}")
             
             print(f"Using bundled Tesseract from: {bundled_path}")
             return bundled_path
@@ -186,9 +224,22 @@ def setup_bundled_binaries(progress_callback=None):
     Setup all bundled binaries (Poppler and Tesseract)
     This is a convenience function to call at application startup
     
+    The setup itself only runs once per process, so calling this again (for
+    example from a worker) costs no filesystem access.
+    
     Args:
         progress_callback: Optional callable that takes a string message to report progress
     """
+    # Put both bundled bin directories on PATH in one write, ahead of the
+    # per-tool setup (which then finds PATH already updated)
+    tesseract_path = get_bundled_tesseract_path()
+    _prepend_to_path([
+        directory for directory in (
+            get_bundled_poppler_path(),
+            os.path.dirname(tesseract_path) if tesseract_path else None,
+        ) if directory
+    ])
+    
     if progress_callback:
         progress_callback("Setting up Poppler binaries...")
     setup_poppler_path()
@@ -4,47 +4,21 @@ QuickPdfOcr - GUI Application Entry Point
 A simple Qt6-based PDF OCR application
 """
 
+import os
 import sys
 from pathlib import Path
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
-from PySide6.QtCore import QTimer
-from ui.main_window import MainWindow
-from ui.loading_screen import LoadingScreen
-from components.poppler_utils import setup_bundled_binaries
 
 # Constants
-LOADING_TO_MAIN_DELAY = 300  # Delay in milliseconds before showing main window
+MIN_LOADING_SCREEN_TIME = 300  # Minimum time in milliseconds the loading screen stays visible
 
 
-def initialize_application(loading_screen):
-    """
-    Initialize application components with progress feedback
-    
-    Args:
-        loading_screen: LoadingScreen instance to update with progress
-    """
-    # Setup bundled binaries (Poppler and Tesseract) if available
-    def progress_callback(message):
-        """Update loading screen with progress message"""
-        loading_screen.set_progress(message)
-        QApplication.processEvents()  # Process GUI events to update the display
-    
-    setup_bundled_binaries(progress_callback=progress_callback)
-    
-    loading_screen.set_progress("Finalizing initialization...")
-    QApplication.processEvents()
-
-
-def main():
-    """Main application entry point"""
-    # Print startup diagnostics
+def _print_diagnostics():
+    """Print the startup diagnostics (enabled with --verbose or QUICKPDFOCR_DEBUG=1)"""
     print("\n" + "="*60)
     print("QuickPdfOcr - Starting Application")
     print("="*60)
     
     # Check if running from bundle
-    import os
     if getattr(sys, 'frozen', False):
         print(f"Running from PyInstaller bundle")
         print(f"Bundle directory: {sys._MEIPASS}")
@@ -52,6 +26,57 @@ def main():
         print(f"Running from Python interpreter")
     
     print("="*60 + "\n")
+
+
+def start_initialization(loading_screen):
+    """
+    Initialize application components in a background thread with progress feedback
+    
+    The loading screen keeps animating while the bundled binaries are set up;
+    its setup_finished signal is emitted on the GUI thread once they are.
+    
+    Args:
+        loading_screen: LoadingScreen instance to update with progress
+    """
+    from PySide6.QtCore import Qt, QThread
+    from components.bundle_setup_worker import BundleSetupWorker
+    
+    # Create worker thread - kept on the loading screen so neither is
+    # garbage collected while the setup runs
+    thread = loading_screen.setup_thread = QThread()
+    worker = loading_screen.setup_worker = BundleSetupWorker()
+    worker.moveToThread(thread)
+    
+    # Connect signals - queued to the loading screen in the GUI thread, which
+    # repaints from its event loop (no processEvents() needed)
+    thread.started.connect(worker.run)
+    worker.progress.connect(loading_screen.set_progress, Qt.ConnectionType.QueuedConnection)
+    worker.finished.connect(loading_screen.setup_finished, Qt.ConnectionType.QueuedConnection)
+    worker.finished.connect(thread.quit)
+    worker.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+    
+    # Start setup
+    thread.start()
+
+
+def main():
+    """Main application entry point"""
+    # Qt and the UI are imported here rather than at module level, so importing
+    # this module (e.g. from tools or tests) doesn't load the Qt libraries.
+    # Only what the loading screen needs is imported before it is shown.
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QIcon
+    from PySide6.QtCore import QElapsedTimer, QTimer
+    from ui.loading_screen import LoadingScreen
+    
+    # --verbose turns on the bundle diagnostics too (read when poppler_utils
+    # is imported by the setup worker)
+    if '--verbose' in sys.argv:
+        os.environ['QUICKPDFOCR_DEBUG'] = '1'
+    verbose = bool(os.environ.get('QUICKPDFOCR_DEBUG'))
+    if verbose:
+        _print_diagnostics()
     
     # Create QApplication first
     app = QApplication(sys.argv)
@@ -59,7 +84,6 @@ def main():
     app.setOrganizationName("QuickPdfOcr")
     
     # Set application icon
-    icon_path = None
     if getattr(sys, 'frozen', False):
         # Running from PyInstaller bundle
         base_path = Path(sys._MEIPASS)
@@ -69,32 +93,44 @@ def main():
     
     # Try to load the icon
     icon_file = base_path / "resources" / "icon.png"
-    if icon_file.exists():
+    if icon_file.is_file():
         app.setWindowIcon(QIcon(str(icon_file)))
-        print(f"Loaded icon from: {icon_file}")
+        if verbose:
+            print(f"Loaded icon from: {icon_file}")
     else:
         print(f"Warning: Icon not found at {icon_file}")
     
-    # Show loading screen immediately
+    # Show loading screen immediately - it is painted once the event loop starts
     loading_screen = LoadingScreen()
     loading_screen.show()
-    QApplication.processEvents()  # Ensure loading screen is displayed
+    shown_timer = QElapsedTimer()
+    shown_timer.start()
     
-    # Initialize application components with progress feedback
-    initialize_application(loading_screen)
-    
-    # Create and show main window
-    loading_screen.set_progress("Loading main window...")
-    QApplication.processEvents()
+    windows = []
     
-    window = MainWindow()
+    def on_setup_finished():
+        """Create the main window once the bundled binaries are set up"""
+        loading_screen.set_progress("Loading main window...")
+        # Build the window on the next event loop iteration, so the message
+        # above is painted before the (blocking) window construction
+        QTimer.singleShot(0, create_main_window)
     
-    # Close loading screen and show main window after fade-out completes
-    def on_initialization_complete():
-        """Handle transition from loading screen to main window"""
-        loading_screen.close_with_fade(on_finished=lambda: window.show())
+    def create_main_window():
+        """Create the main window and hand over from the loading screen"""
+        from ui.main_window import MainWindow
+        window = MainWindow()
+        windows.append(window)  # Keep the window alive after this function returns
+        window.initialize()
+        
+        # Close loading screen and show main window after fade-out completes.
+        # Only wait for whatever is left of the minimum display time, so a slow
+        # setup isn't delayed further and a fast one doesn't just flash.
+        remaining = max(0, MIN_LOADING_SCREEN_TIME - shown_timer.elapsed())
+        QTimer.singleShot(remaining, lambda: loading_screen.close_with_fade(on_finished=window.show))
     
-    QTimer.singleShot(LOADING_TO_MAIN_DELAY, on_initialization_complete)
+    # Initialize application components with progress feedback
+    loading_screen.setup_finished.connect(on_setup_finished)
+    start_initialization(loading_screen)
     
     sys.exit(app.exec())
 
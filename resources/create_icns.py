@@ -5,10 +5,29 @@ Uses iconutil-compatible iconset structure
 """
 
 import os
+import platform
 import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 
+# Smaller sizes are resized with BICUBIC - LANCZOS looks no different there
+LANCZOS_MIN_SIZE = 128
+
+def _save_png(image, paths):
+    """
+    Save an image as PNG to one or more paths, encoding it only once
+    
+    Args:
+        image (Image): Image to save
+        paths (list): Output paths
+    """
+    image.save(paths[0], 'PNG')
+    for path in paths[1:]:
+        shutil.copyfile(paths[0], path)
+
+
 def create_icns_from_png(png_path, output_icns_path):
     """
     Create a macOS .icns file from a PNG image
@@ -42,65 +61,65 @@ def create_icns_from_png(png_path, output_icns_path):
     
     print(f"Creating iconset in: {iconset_dir}")
     
-    # Generate each required size
+    # Resize each distinct size once, largest first: every downscale starts
+    # from the previous (smallest so far) result instead of the full source
+    resized_images = {}
+    current = img
+    for actual_size in sorted({size * scale for size, scale, _ in icon_sizes}, reverse=True):
+        # Sizes above the source size can only be made from the source itself
+        source = img if actual_size >= img.width else current
+        resample = (Image.Resampling.LANCZOS if actual_size >= LANCZOS_MIN_SIZE
+                    else Image.Resampling.BICUBIC)
+        current = resized_images[actual_size] = source.resize(
+            (actual_size, actual_size), resample
+        )
+    
+    # Files sharing a pixel size (e.g. 32x32@2x and 64x64)
+    output_paths = {}
     for size, scale, filename in icon_sizes:
         actual_size = size * scale
         print(f"  - {filename} ({actual_size}x{actual_size})")
+        output_paths.setdefault(actual_size, []).append(iconset_dir / filename)
+    
+    # Generate each required size - PNG encoding releases the GIL, so the
+    # files are written in parallel (one task per image, as saving isn't
+    # thread-safe for a single image)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        saves = [
+            executor.submit(_save_png, resized_images[actual_size], paths)
+            for actual_size, paths in output_paths.items()
+        ]
         
-        # Resize image
-        resized = img.resize((actual_size, actual_size), Image.Resampling.LANCZOS)
-        
-        # Save to iconset directory
-        output_path = iconset_dir / filename
-        resized.save(output_path, 'PNG')
+        # Raise any error from saving
+        for save in saves:
+            save.result()
     
     print(f"\nIconset created successfully!")
     print(f"Directory: {iconset_dir}")
     
-    # Try to convert to .icns using iconutil (only works on macOS)
-    try:
-        import subprocess
-        result = subprocess.run(
-            ['iconutil', '-c', 'icns', str(iconset_dir), '-o', str(output_icns_path)],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode == 0:
-            print(f"\n✅ Successfully created: {output_icns_path}")
-            # Clean up iconset directory
-            shutil.rmtree(iconset_dir)
-            print(f"Cleaned up temporary iconset directory")
-        else:
-            print(f"\n⚠️  iconutil not available (this is normal on non-macOS systems)")
-            print(f"   Iconset directory created: {iconset_dir}")
-            print(f"   On macOS, run: iconutil -c icns {iconset_dir} -o {output_icns_path}")
-            
-            # As a fallback, create a simple .icns from PNG using PIL
-            # This won't be as good as iconutil but will work cross-platform
-            print(f"\n   Creating basic .icns file using PIL...")
-            try:
-                # Load the largest size and save as ICNS
-                img_1024 = img.resize((1024, 1024), Image.Resampling.LANCZOS)
-                img_1024.save(output_icns_path, 'ICNS')
-                print(f"   ✅ Created basic .icns: {output_icns_path}")
-            except Exception as e:
-                print(f"   ⚠️  Could not create .icns: {e}")
-                print(f"   You can manually convert the iconset on macOS")
-    except FileNotFoundError:
-        print(f"\n⚠️  iconutil not found (this is normal on non-macOS systems)")
+    # Convert to .icns using iconutil (only available on macOS) - elsewhere
+    # the iconset is left for a macOS machine or CI runner to finish
+    if platform.system() != "Darwin":
+        print(f"\n⚠️  iconutil is only available on macOS")
         print(f"   Iconset directory created: {iconset_dir}")
         print(f"   On macOS, run: iconutil -c icns {iconset_dir} -o {output_icns_path}")
-        
-        # Create basic .icns using PIL
-        print(f"\n   Creating basic .icns file using PIL...")
-        try:
-            img_1024 = img.resize((1024, 1024), Image.Resampling.LANCZOS)
-            img_1024.save(output_icns_path, 'ICNS')
-            print(f"   ✅ Created basic .icns: {output_icns_path}")
-        except Exception as e:
-            print(f"   ⚠️  Could not create .icns: {e}")
-            print(f"   You may need to convert the iconset manually on macOS")
+        return
+    
+    result = subprocess.run(
+        ['iconutil', '-c', 'icns', str(iconset_dir), '-o', str(output_icns_path)],
+        capture_output=True,
+        text=True
+    )
+    
+    if result.returncode == 0:
+        print(f"\n✅ Successfully created: {output_icns_path}")
+        # Clean up iconset directory
+        shutil.rmtree(iconset_dir)
+        print(f"Cleaned up temporary iconset directory")
+    else:
+        print(f"\n⚠️  iconutil failed: {result.stderr.strip()}")
+        print(f"   Iconset directory created: {iconset_dir}")
+        print(f"   Run manually: iconutil -c icns {iconset_dir} -o {output_icns_path}")
 
 
 def main():
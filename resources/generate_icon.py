@@ -7,6 +7,11 @@ Creates a PNG icon representing PDF + OCR functionality
 from PIL import Image, ImageDraw, ImageFont
 import os
 
+# The icon is drawn once at this size and scaled down for every output size
+MASTER_SIZE = 1024
+# Smaller sizes are resized with BICUBIC - LANCZOS looks no different there
+LANCZOS_MIN_SIZE = 128
+
 def create_icon(size=256):
     """
     Create an icon for the QuickPdfOcr application
@@ -59,17 +64,26 @@ def create_icon(size=256):
     line_width = doc_width * 0.7
     line_height = size * 0.015
     
+    # The lines only differ in position and (for the last one) length, so each
+    # length is rasterized once and pasted with itself as the mask
+    line_templates = {}
+    
     num_lines = 6
+    line_left = round(doc_left + (doc_width - line_width) / 2)
     for i in range(num_lines):
         y_pos = doc_top + line_margin + (i * line_spacing)
         # Vary line lengths slightly
         current_line_width = line_width * (0.9 if i == num_lines - 1 else 1.0)
-        draw.rounded_rectangle(
-            [doc_left + (doc_width - line_width) / 2, y_pos,
-             doc_left + (doc_width - line_width) / 2 + current_line_width, y_pos + line_height],
-            radius=line_height / 2,
-            fill=text_lines_color
-        )
+        template = line_templates.get(current_line_width)
+        if template is None:
+            template = Image.new('RGBA', (round(current_line_width) + 1, round(line_height) + 1), (0, 0, 0, 0))
+            ImageDraw.Draw(template).rounded_rectangle(
+                [0, 0, current_line_width, line_height],
+                radius=line_height / 2,
+                fill=text_lines_color
+            )
+            line_templates[current_line_width] = template
+        img.paste(template, (line_left, round(y_pos)), template)
     
     # Draw "PDF" badge in top-right corner
     badge_size = size * 0.25
@@ -128,22 +142,26 @@ def create_icon(size=256):
     scan_line_color = (33, 150, 243, 150)  # Semi-transparent blue
     scan_line_width = int(size * 0.008)
     
+    # Small arrows on the right of the lines to show movement
+    doc_right = doc_left + doc_width
+    arrow_size = size * 0.03
+    arrow_back = doc_right - arrow_size
+    
     # Draw 3 scanning lines
     for i in range(3):
         y_offset = doc_top + doc_height * 0.45 + (i * size * 0.08)
         # Draw horizontal scanning line
         draw.line(
-            [doc_left, y_offset, doc_left + doc_width, y_offset],
+            [doc_left, y_offset, doc_right, y_offset],
             fill=scan_line_color,
             width=scan_line_width
         )
-        # Draw small arrows on the right to show movement
-        arrow_size = size * 0.03
+        # Draw small arrow
         draw.polygon(
             [
-                (doc_left + doc_width, y_offset),
-                (doc_left + doc_width - arrow_size, y_offset - arrow_size / 2),
-                (doc_left + doc_width - arrow_size, y_offset + arrow_size / 2)
+                (doc_right, y_offset),
+                (arrow_back, y_offset - arrow_size / 2),
+                (arrow_back, y_offset + arrow_size / 2)
             ],
             fill=scan_line_color
         )
@@ -155,9 +173,22 @@ def main():
     """Generate all required icon sizes"""
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
+    # Draw once at high resolution - resizing is much cheaper than drawing
+    # again and gives antialiased edges at the small sizes
+    master = create_icon(MASTER_SIZE)
+    scaled = {}
+    
+    def icon_at(size):
+        """Get the icon scaled to a size (each size is resized only once)"""
+        if size not in scaled:
+            resample = (Image.Resampling.LANCZOS if size >= LANCZOS_MIN_SIZE
+                        else Image.Resampling.BICUBIC)
+            scaled[size] = master.resize((size, size), resample)
+        return scaled[size]
+    
     # Generate main icon at 256x256
     print("Generating icon at 256x256...")
-    icon_256 = create_icon(256)
+    icon_256 = icon_at(256)
     icon_path_256 = os.path.join(script_dir, "icon.png")
     icon_256.save(icon_path_256, "PNG")
     print(f"Saved: {icon_path_256}")
@@ -170,15 +201,15 @@ def main():
     ico_images = []
     for size in sizes:
         print(f"  - {size}x{size}")
-        img = create_icon(size)
-        ico_images.append(img)
+        ico_images.append(icon_at(size))
     
     ico_path = os.path.join(script_dir, "icon.ico")
-    # Save with all images for proper multi-size ICO
-    ico_images[0].save(
+    # Save with all images for proper multi-size ICO - Pillow drops sizes larger
+    # than the image save() is called on, so it's called on the largest one
+    ico_images[-1].save(
         ico_path,
         format='ICO',
-        append_images=ico_images[1:],
+        append_images=ico_images[:-1],
         sizes=[(s, s) for s in sizes]
     )
     print(f"Saved: {ico_path}")
@@ -186,7 +217,7 @@ def main():
     # For macOS, we need .icns format which requires iconutil or external tools
     # We'll create a high-res PNG that can be converted to .icns later
     print("\nGenerating high-resolution PNG for macOS .icns conversion...")
-    icon_512 = create_icon(512)
+    icon_512 = icon_at(512)
     icon_path_512 = os.path.join(script_dir, "icon_512.png")
     icon_512.save(icon_path_512, "PNG")
     print(f"Saved: {icon_path_512}")
@@ -2,12 +2,22 @@
 """
 Test script to verify bundled dependencies are properly configured
 This helps diagnose issues with Poppler and Tesseract in the bundled executable
+
+Options:
+    --skip-imports  Don't import pdf2image and pytesseract
+    --no-wait       Exit without waiting for Enter (also skipped when stdin isn't a terminal)
 """
 
+import argparse
+import heapq
+import itertools
 import sys
 import os
 from pathlib import Path
 
+# Import pdf2image/pytesseract as a smoke check (turned off with --skip-imports)
+CHECK_IMPORTS = True
+
 
 def test_bundle_detection():
     """Test if running from PyInstaller bundle"""
@@ -22,7 +32,7 @@ def test_bundle_detection():
         
         # List contents of bundle directory
         print("\nBundle directory contents:")
-        for item in sorted(bundle_dir.iterdir())[:20]:  # Show first 20 items
+        for item in heapq.nsmallest(20, bundle_dir.iterdir(), key=lambda p: p.name):  # Show first 20 items
             print(f"  - {item.name}")
         
         return bundle_dir
@@ -50,7 +60,7 @@ def test_poppler():
             
             # List contents
             print(f"\n  Directory contents:")
-            for item in sorted(poppler_dir.iterdir())[:10]:  # Show first 10
+            for item in heapq.nsmallest(10, poppler_dir.iterdir(), key=lambda p: p.name):  # Show first 10
                 print(f"    - {item.name}")
             
             # Check for critical executables
@@ -75,6 +85,8 @@ def test_poppler():
     setup_poppler_path()
     
     # Test pdf2image
+    if not CHECK_IMPORTS:
+        return
     print(f"\nTesting pdf2image import...")
     try:
         from pdf2image import convert_from_path
@@ -109,12 +121,17 @@ def test_tesseract():
             tessdata_path = bundle_dir / "tesseract" / "tessdata"
             
             if tessdata_path.exists():
-                traineddata_files = list(tessdata_path.glob("*.traineddata"))
-                print(f"  ✓ tessdata directory found with {len(traineddata_files)} language file(s)")
+                # Keep the first few names for display and only count the rest
+                traineddata_files = tessdata_path.glob("*.traineddata")
+                shown_files = list(itertools.islice(traineddata_files, 10))
+                file_count = len(shown_files) + sum(1 for _ in traineddata_files)
+                print(f"  ✓ tessdata directory found with {file_count} language file(s)")
                 
                 # List language files
-                for lang_file in traineddata_files:
+                for lang_file in shown_files:
                     print(f"    - {lang_file.name}")
+                if file_count > len(shown_files):
+                    print(f"    ... and {file_count - len(shown_files)} more")
             else:
                 print(f"  ✗ tessdata directory not found at: {tessdata_path}")
     else:
@@ -125,6 +142,8 @@ def test_tesseract():
     setup_tesseract_path()
     
     # Test pytesseract
+    if not CHECK_IMPORTS:
+        return
     print(f"\nTesting pytesseract import...")
     try:
         import pytesseract
@@ -140,6 +159,15 @@ def test_tesseract():
 
 def main():
     """Run all tests"""
+    global CHECK_IMPORTS
+    parser = argparse.ArgumentParser(description="Check the bundled Poppler and Tesseract setup")
+    parser.add_argument("--skip-imports", action="store_true",
+                        help="Don't import pdf2image and pytesseract (faster, bundle layout only)")
+    parser.add_argument("--no-wait", action="store_true",
+                        help="Exit without waiting for Enter (for CI and scripts)")
+    args = parser.parse_args()
+    CHECK_IMPORTS = not args.skip_imports
+    
     print("\n")
     print("╔" + "="*58 + "╗")
     print("║" + " "*15 + "DEPENDENCY TEST SUITE" + " "*22 + "║")
@@ -165,7 +193,10 @@ def main():
     print("misconfigured dependencies that need to be fixed.")
     print("\n" + "="*60 + "\n")
     
-    input("Press Enter to exit...")
+    # Keeps the console window of a double-clicked bundle open - never block
+    # when run non-interactively
+    if not args.no_wait and sys.stdin.isatty():
+        input("Press Enter to exit...")
 
 
 if __name__ == "__main__":
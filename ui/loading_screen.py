@@ -4,36 +4,96 @@ Displays a splash screen with progress feedback during application initializatio
 """
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import Qt, Property, QPropertyAnimation, QEasingCurve, Signal
 from PySide6.QtGui import QPainter, QPen, QColor, QGuiApplication
 
+# Frameless splash window that stays above other windows
+SPLASH_WINDOW_FLAGS = Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint
+
+# Styles for the whole loading screen - set once on the window, so Qt parses a
+# single stylesheet instead of one per widget. Widgets are selected by objectName.
+LOADING_SCREEN_STYLE = """
+    QWidget {
+        background-color: white;
+        border-radius: 15px;
+    }
+    QLabel#title {
+        color: #2196F3;
+        font-size: 32px;
+        font-weight: bold;
+        background: transparent;
+        padding: 10px;
+    }
+    QLabel#subtitle {
+        color: #666;
+        font-size: 14px;
+        background: transparent;
+        padding: 5px;
+    }
+    QWidget#spinnerContainer {
+        background: transparent;
+    }
+    QLabel#progress {
+        color: #888;
+        font-size: 13px;
+        background: transparent;
+        padding: 10px;
+        min-height: 20px;
+    }
+"""
+
 
 class SpinnerWidget(QWidget):
     """Animated spinner widget"""
     
+    # Degrees the arc moves per repaint, and time for one full turn (ms)
+    ANGLE_STEP = 10
+    TURN_DURATION = 1800
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.angle = 0
+        self._angle = 0
         self.setFixedSize(60, 60)
         
-        # Animation timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._rotate)
+        # Pen and arc bounds are the same for every frame
+        self._pen = QPen(QColor("#2196F3"), 4, Qt.PenStyle.SolidLine)
+        self._pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        self._arc_rect = self.rect().adjusted(5, 5, -5, -5)
+        
+        # Rotation is driven by Qt's animation framework rather than a Python timer
+        self.animation = QPropertyAnimation(self, b"angle", self)
+        self.animation.setDuration(self.TURN_DURATION)
+        self.animation.setStartValue(0)
+        self.animation.setEndValue(360)
+        self.animation.setLoopCount(-1)  # Spin until stopped
+    
+    def _get_angle(self):
+        return self._angle
+    
+    def _set_angle(self, angle):
+        # Repaint only when the arc moves a whole step (every 50 ms, as before),
+        # not on every animation tick
+        angle -= angle % self.ANGLE_STEP
+        if angle != self._angle:
+            self._angle = angle
+            self.update()
+    
+    angle = Property(int, _get_angle, _set_angle)
     
     def showEvent(self, event):
         """Start animation when widget becomes visible"""
         super().showEvent(event)
-        self.timer.start(50)  # Update every 50ms for smooth animation (20 FPS)
+        self.animation.start()
     
     def hideEvent(self, event):
         """Stop animation when widget is hidden to save CPU resources"""
         super().hideEvent(event)
-        self.timer.stop()
+        self.animation.stop()
     
-    def _rotate(self):
-        """Rotate the spinner"""
-        self.angle = (self.angle + 10) % 360
-        self.update()
+    def resizeEvent(self, event):
+        """Keep the arc inside the widget"""
+        super().resizeEvent(event)
+        self._arc_rect = self.rect().adjusted(5, 5, -5, -5)
     
     def paintEvent(self, event):
         """Paint the spinner"""
@@ -41,116 +101,95 @@ class SpinnerWidget(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw spinning arc
-        pen = QPen(QColor("#2196F3"), 4, Qt.PenStyle.SolidLine)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen)
-        
-        rect = self.rect().adjusted(5, 5, -5, -5)
-        painter.drawArc(rect, self.angle * 16, 120 * 16)
+        painter.setPen(self._pen)
+        painter.drawArc(self._arc_rect, self._angle * 16, 120 * 16)
 
 
 class LoadingScreen(QWidget):
     """Loading screen with spinner and progress messages"""
     
+    # Background setup finished - connect a worker's finished signal to this so
+    # the follow-up work runs on the GUI thread
+    setup_finished = Signal()
+    
     def __init__(self):
         super().__init__()
         self._setup_ui()
         
         # Make it frameless and stay on top
-        self.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint | 
-            Qt.WindowType.WindowStaysOnTopHint
-        )
+        self.setWindowFlags(SPLASH_WINDOW_FLAGS)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         
         # Setup animations
         self.setWindowOpacity(0)
         
-        # Fade in animation
-        self.fade_in_animation = QPropertyAnimation(self, b"windowOpacity")
-        self.fade_in_animation.setDuration(300)
-        self.fade_in_animation.setStartValue(0)
-        self.fade_in_animation.setEndValue(1)
-        self.fade_in_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        # Fade in and fade out animations - created when first needed, then reused
+        self.fade_in_animation = None
+        self.fade_out_animation = None
+    
+    def _make_fade(self, start: float, end: float, duration: int) -> QPropertyAnimation:
+        """
+        Create a window opacity animation
+        
+        Args:
+            start (float): Opacity at the start
+            end (float): Opacity at the end
+            duration (int): Duration in milliseconds
         
-        # Fade out animation
-        self.fade_out_animation = QPropertyAnimation(self, b"windowOpacity")
-        self.fade_out_animation.setDuration(200)
-        self.fade_out_animation.setStartValue(1)
-        self.fade_out_animation.setEndValue(0)
-        self.fade_out_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        Returns:
+            QPropertyAnimation: The (not yet started) animation
+        """
+        animation = QPropertyAnimation(self, b"windowOpacity", self)
+        animation.setDuration(duration)
+        animation.setStartValue(start)
+        animation.setEndValue(end)
+        animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        return animation
     
     def _setup_ui(self):
         """Setup the user interface"""
+        align_center = Qt.AlignmentFlag.AlignCenter
         self.setFixedSize(400, 300)
         
         # Main layout
         layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.setAlignment(align_center)
         layout.setContentsMargins(30, 30, 30, 30)
         
-        # Background styling
-        self.setStyleSheet("""
-            QWidget {
-                background-color: white;
-                border-radius: 15px;
-            }
-        """)
+        # Background and widget styling
+        self.setStyleSheet(LOADING_SCREEN_STYLE)
         
         # App name/title
         title_label = QLabel("QuickPdfOcr")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #2196F3;
-                font-size: 32px;
-                font-weight: bold;
-                background: transparent;
-                padding: 10px;
-            }
-        """)
+        title_label.setAlignment(align_center)
+        title_label.setObjectName("title")
         layout.addWidget(title_label)
         
         # Subtitle
         subtitle_label = QLabel("Starting application...")
-        subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                font-size: 14px;
-                background: transparent;
-                padding: 5px;
-            }
-        """)
+        subtitle_label.setAlignment(align_center)
+        subtitle_label.setObjectName("subtitle")
         layout.addWidget(subtitle_label)
         
         layout.addSpacing(20)
         
         # Spinner
         spinner_container = QWidget()
-        spinner_container.setStyleSheet("background: transparent;")
+        spinner_container.setObjectName("spinnerContainer")
         spinner_layout = QVBoxLayout(spinner_container)
-        spinner_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        spinner_layout.setAlignment(align_center)
         spinner_layout.setContentsMargins(0, 0, 0, 0)
         
         self.spinner = SpinnerWidget()
-        spinner_layout.addWidget(self.spinner, 0, Qt.AlignmentFlag.AlignCenter)
+        spinner_layout.addWidget(self.spinner, 0, align_center)
         layout.addWidget(spinner_container)
         
         layout.addSpacing(20)
         
         # Progress message label
         self.progress_label = QLabel("Initializing...")
-        self.progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.progress_label.setStyleSheet("""
-            QLabel {
-                color: #888;
-                font-size: 13px;
-                background: transparent;
-                padding: 10px;
-                min-height: 20px;
-            }
-        """)
+        self.progress_label.setAlignment(align_center)
+        self.progress_label.setObjectName("progress")
         self.progress_label.setWordWrap(True)
         layout.addWidget(self.progress_label)
         
@@ -170,6 +209,8 @@ class LoadingScreen(QWidget):
         )
         
         # Show and start fade-in animation
+        if self.fade_in_animation is None:
+            self.fade_in_animation = self._make_fade(0, 1, 300)
         super().show()
         self.fade_in_animation.start()
     
@@ -180,11 +221,11 @@ class LoadingScreen(QWidget):
         Args:
             on_finished: Optional callback to execute after fade-out completes
         """
-        # Disconnect any previous finished connections to avoid duplicate calls
-        try:
+        if self.fade_out_animation is None:
+            self.fade_out_animation = self._make_fade(1, 0, 200)
+        else:
+            # Disconnect the previous call's connections to avoid duplicate calls
             self.fade_out_animation.finished.disconnect()
-        except TypeError:
-            pass  # No connections to disconnect
         
         # Connect close signal
         self.fade_out_animation.finished.connect(self.close)
@@ -193,5 +234,9 @@ class LoadingScreen(QWidget):
         if on_finished:
             self.fade_out_animation.finished.connect(on_finished)
         
+        # Nothing is waiting on the spinner any more - stop it rather than
+        # repainting it while the window fades out
+        self.spinner.animation.stop()
+        
         # Start fade-out animation
         self.fade_out_animation.start()
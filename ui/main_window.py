@@ -4,80 +4,319 @@ Features: drag-and-drop file upload, OCR processing with progress feedback,
 text display with copy functionality
 """
 
-from pathlib import Path
+import os
+from collections import deque
+from enum import Enum
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QLabel, QTextEdit, QFileDialog, QMessageBox
+    QPushButton, QLabel, QTextEdit, QFileDialog, QCheckBox
 )
-from PySide6.QtCore import Qt, Signal, QThread
-from PySide6.QtGui import QDragEnterEvent, QDropEvent
+from PySide6.QtCore import Qt, Signal, QThreadPool, QTimer
+from PySide6.QtGui import QDragEnterEvent, QDropEvent, QGuiApplication, QTextCursor
 
 from components.ocr_worker import OCRWorker
 
 
+# Stylesheets - built once and shared, so switching a widget between states
+# passes Qt the same string instead of a new literal every time
+
+# Drop zone, idle and while a file is dragged over it
+DROP_ZONE_STYLE = """
+    QLabel {
+        border: 3px dashed #aaa;
+        border-radius: 10px;
+        padding: 40px;
+        background-color: #f5f5f5;
+        font-size: 16px;
+        color: #666;
+    }
+    QLabel:hover {
+        border-color: #2196F3;
+        background-color: #e3f2fd;
+        color: #1976D2;
+    }
+"""
+DROP_ZONE_ACTIVE_STYLE = """
+    QLabel {
+        border: 3px dashed #2196F3;
+        border-radius: 10px;
+        padding: 40px;
+        background-color: #e3f2fd;
+        font-size: 16px;
+        color: #1976D2;
+    }
+"""
+
+# Selected file name
+FILE_LABEL_STYLE = "color: #333; font-weight: bold;"
+
+# Force OCR option
+FORCE_OCR_STYLE = "color: #555;"
+
+# Buttons
+OPEN_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1976D2;
+    }
+    QPushButton:pressed {
+        background-color: #0D47A1;
+    }
+"""
+START_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #2E7D32;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+"""
+COPY_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #FF9800;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #F57C00;
+    }
+    QPushButton:pressed {
+        background-color: #E65100;
+    }
+"""
+RETRY_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #f44336;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #d32f2f;
+    }
+    QPushButton:pressed {
+        background-color: #b71c1c;
+    }
+"""
+START_OVER_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #9E9E9E;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #757575;
+    }
+    QPushButton:pressed {
+        background-color: #616161;
+    }
+"""
+
+# Progress label while working, after success and after an error
+PROGRESS_INFO_STYLE = """
+    QLabel {
+        color: #1976D2;
+        font-size: 14px;
+        padding: 10px;
+        background-color: #e3f2fd;
+        border-radius: 5px;
+    }
+"""
+PROGRESS_SUCCESS_STYLE = """
+    QLabel {
+        color: #2E7D32;
+        font-size: 14px;
+        padding: 10px;
+        background-color: #C8E6C9;
+        border-radius: 5px;
+    }
+"""
+PROGRESS_WARNING_STYLE = """
+    QLabel {
+        color: #E65100;
+        font-size: 14px;
+        padding: 10px;
+        background-color: #FFE0B2;
+        border-radius: 5px;
+    }
+"""
+PROGRESS_ERROR_STYLE = """
+    QLabel {
+        color: #C62828;
+        font-size: 14px;
+        padding: 10px;
+        background-color: #FFCDD2;
+        border-radius: 5px;
+    }
+"""
+
+# Results text area
+TEXT_AREA_STYLE = """
+    QTextEdit {
+        border: 1px solid #ccc;
+        border-radius: 5px;
+        padding: 10px;
+        font-family: monospace;
+        font-size: 12px;
+    }
+"""
+
+# "Copied" toast shown over the bottom of the window
+TOAST_STYLE = """
+    QLabel {
+        color: white;
+        font-size: 13px;
+        padding: 8px 16px;
+        background-color: rgba(0, 0, 0, 180);
+        border-radius: 5px;
+    }
+"""
+
+
+def _pdf_paths(mime_data) -> list:
+    """
+    Get the local PDF files of a drag
+    
+    Args:
+        mime_data (QMimeData): Data of the drag or drop event
+    
+    Returns:
+        list: Paths of the dragged PDF files, in drag order (empty if there are none)
+    """
+    return [
+        path for path in (url.toLocalFile() for url in mime_data.urls())
+        if path.lower().endswith('.pdf')
+    ]
+
+
+class _LazyWidget:
+    """
+    Widget attribute of MainWindow that is built on first access
+    
+    The window's _build_<name>() creates the widget, which is then added to its
+    layout (hidden - the window's state shows it) and kept like a plain attribute.
+    """
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, window, owner=None):
+        if window is None:
+            return self
+        widget = getattr(window, f"_build_{self.name.lstrip('_')}")()
+        widget.hide()
+        window._place_widget(self.name, widget)
+        # Stored on the instance, so later lookups don't reach this descriptor
+        window.__dict__[self.name] = widget
+        return widget
+
+
+# Top-to-bottom order of the main layout and left-to-right order of the
+# button row - lazily built widgets are inserted at their place in it
+MAIN_LAYOUT_WIDGETS = (
+    'drop_zone', 'open_btn', 'file_label', 'force_ocr_check', 'start_ocr_btn', 'progress_label', 'text_area'
+)
+BUTTON_LAYOUT_WIDGETS = ('copy_btn', 'retry_btn', 'start_over_btn')
+
+
+class UIState(Enum):
+    """Stages of the main window workflow"""
+    IDLE = "idle"                    # Nothing selected
+    FILE_SELECTED = "file_selected"  # PDF chosen, OCR not started
+    PROCESSING = "processing"        # OCR running
+    SUCCESS = "success"              # Text extracted
+    ERROR = "error"                  # OCR failed
+
+
+# Widgets shown (True) or hidden (False) in each state - widgets not listed
+# keep their visibility (the results area is shown as soon as the first page
+# arrives)
+STATE_VISIBILITY = {
+    UIState.IDLE: {
+        'file_label': False, 'force_ocr_check': False, 'start_ocr_btn': False, 'progress_label': False,
+        'text_area': False, 'copy_btn': False, 'retry_btn': False, 'start_over_btn': False,
+    },
+    UIState.FILE_SELECTED: {
+        'file_label': True, 'force_ocr_check': True, 'start_ocr_btn': True, 'progress_label': False,
+        'text_area': False, 'copy_btn': False, 'retry_btn': False, 'start_over_btn': False,
+    },
+    UIState.PROCESSING: {
+        'progress_label': True, 'copy_btn': False, 'retry_btn': False, 'start_over_btn': False,
+    },
+    UIState.SUCCESS: {
+        'progress_label': True, 'text_area': True, 'copy_btn': True, 'retry_btn': False,
+        'start_over_btn': True,
+    },
+    UIState.ERROR: {
+        'progress_label': True, 'copy_btn': False, 'retry_btn': True, 'start_over_btn': True,
+    },
+}
+
+
 class DropZoneLabel(QLabel):
     """Custom label that accepts drag-and-drop file operations"""
     
-    file_dropped = Signal(str)
+    files_dropped = Signal(list)  # Dropped PDF paths, in drop order
     
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
         self.setAcceptDrops(True)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setStyleSheet("""
-            QLabel {
-                border: 3px dashed #aaa;
-                border-radius: 10px;
-                padding: 40px;
-                background-color: #f5f5f5;
-                font-size: 16px;
-                color: #666;
-            }
-            QLabel:hover {
-                border-color: #2196F3;
-                background-color: #e3f2fd;
-                color: #1976D2;
-            }
-        """)
+        self._style = None
+        self._set_style(DROP_ZONE_STYLE)
+    
+    def _set_style(self, style: str):
+        """Switch stylesheets - skipped if the style is already set (Qt would re-polish)"""
+        if style is not self._style:
+            self._style = style
+            self.setStyleSheet(style)
     
     def dragEnterEvent(self, event: QDragEnterEvent):
-        """Accept drag events with files"""
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-            self.setStyleSheet("""
-                QLabel {
-                    border: 3px dashed #2196F3;
-                    border-radius: 10px;
-                    padding: 40px;
-                    background-color: #e3f2fd;
-                    font-size: 16px;
-                    color: #1976D2;
-                }
-            """)
+        """Accept drags that contain at least one PDF file"""
+        # Other drags are refused here, so the cursor shows they can't be
+        # dropped and the drop zone isn't highlighted for them
+        if not _pdf_paths(event.mimeData()):
+            event.ignore()
+            return
+        event.acceptProposedAction()
+        self._set_style(DROP_ZONE_ACTIVE_STYLE)
     
     def dragLeaveEvent(self, event):
         """Reset style when drag leaves"""
-        self.setStyleSheet("""
-            QLabel {
-                border: 3px dashed #aaa;
-                border-radius: 10px;
-                padding: 40px;
-                background-color: #f5f5f5;
-                font-size: 16px;
-                color: #666;
-            }
-            QLabel:hover {
-                border-color: #2196F3;
-                background-color: #e3f2fd;
-                color: #1976D2;
-            }
-        """)
+        self._set_style(DROP_ZONE_STYLE)
     
     def dropEvent(self, event: QDropEvent):
         """Handle dropped files"""
-        files = [url.toLocalFile() for url in event.mimeData().urls()]
-        if files and files[0].lower().endswith('.pdf'):
-            self.file_dropped.emit(files[0])
+        pdfs = _pdf_paths(event.mimeData())
+        if pdfs:
+            self.files_dropped.emit(pdfs)
         event.acceptProposedAction()
         self.dragLeaveEvent(event)
 
@@ -85,355 +324,504 @@ class DropZoneLabel(QLabel):
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Minimum time between progress label updates (ms)
+    PROGRESS_INTERVAL = 100
+    # How long the "Copied" toast stays visible (ms)
+    TOAST_DURATION = 1500
+    
+    # Widgets most sessions need late or never - built on first use so the
+    # window starts with just the drop zone and the open button
+    file_label = _LazyWidget()
+    force_ocr_check = _LazyWidget()
+    start_ocr_btn = _LazyWidget()
+    progress_label = _LazyWidget()
+    text_area = _LazyWidget()
+    copy_btn = _LazyWidget()
+    retry_btn = _LazyWidget()
+    start_over_btn = _LazyWidget()
+    _toast = _LazyWidget()
+    
     def __init__(self):
         super().__init__()
         self.current_file = None
-        self.ocr_thread = None
-        self.ocr_worker = None
+        self.ocr_signals = None
+        # Text shown in the results area - copied as is, without reading it back
+        self._last_text = ""
+        # Where the current file's text starts in the results area - pages are
+        # appended as they arrive and removed again if the file fails
+        self._file_text_start = 0
+        
+        # One OCR task at a time - each PDF already OCRs its pages on every
+        # core. The pool keeps its thread between files instead of starting a
+        # new QThread for each one.
+        self.ocr_pool = QThreadPool(self)
+        self.ocr_pool.setMaxThreadCount(1)
+        
+        # Progress messages are shown at most every PROGRESS_INTERVAL ms - only
+        # the latest one is kept in between
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.PROGRESS_INTERVAL)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        # Files selected together are OCRed one after another without further
+        # clicks: the queue holds the files after current_file, and the text of
+        # finished files is collected in batch_texts (None for a single file)
+        self.file_queue = deque()
+        self.batch_texts = None
+        self.batch_size = 0
+        # Files of the current batch that failed
+        self.batch_failures = 0
         
         self.setWindowTitle("QuickPdfOcr")
         self.setMinimumSize(600, 500)
         
+        # Widgets are built by initialize(), so constructing the window is cheap
+        self._initialized = False
+        # Widget visibility and enabled controls follow the state (see _apply_state()),
+        # and no new run can start while it is PROCESSING
+        self._state = UIState.IDLE
+    
+    def initialize(self):
+        """
+        Build the window contents
+        
+        Called once before the window is first shown (later calls do nothing);
+        showEvent() calls it too in case the caller didn't.
+        """
+        if self._initialized:
+            return
+        self._initialized = True
         self._setup_ui()
     
+    def showEvent(self, event):
+        """Make sure the contents exist before the window is first painted"""
+        self.initialize()
+        super().showEvent(event)
+    
     def _setup_ui(self):
         """Setup the user interface"""
         # Central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
-        layout = QVBoxLayout(central_widget)
-        layout.setSpacing(15)
-        layout.setContentsMargins(20, 20, 20, 20)
+        self._main_layout = QVBoxLayout(central_widget)
+        self._main_layout.setSpacing(15)
+        self._main_layout.setContentsMargins(20, 20, 20, 20)
         
         # Drop zone label
         self.drop_zone = DropZoneLabel("📄 Drop PDF file here")
-        self.drop_zone.file_dropped.connect(self._on_file_dropped)
-        layout.addWidget(self.drop_zone)
+        self.drop_zone.files_dropped.connect(self._enqueue_files)
+        self._main_layout.addWidget(self.drop_zone)
         
         # Open file button
         self.open_btn = QPushButton("📁 Open PDF File")
         self.open_btn.setMinimumHeight(40)
-        self.open_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #0D47A1;
-            }
-        """)
+        self.open_btn.setStyleSheet(OPEN_BUTTON_STYLE)
         self.open_btn.clicked.connect(self._open_file_dialog)
-        layout.addWidget(self.open_btn)
-        
-        # File name label (hidden initially)
-        self.file_label = QLabel("")
-        self.file_label.setStyleSheet("color: #333; font-weight: bold;")
-        self.file_label.hide()
-        layout.addWidget(self.file_label)
-        
-        # Start OCR button (hidden initially)
-        self.start_ocr_btn = QPushButton("🚀 Start OCR")
-        self.start_ocr_btn.setMinimumHeight(40)
-        self.start_ocr_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #2E7D32;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
-        self.start_ocr_btn.clicked.connect(self._start_ocr)
-        self.start_ocr_btn.hide()
-        layout.addWidget(self.start_ocr_btn)
-        
-        # Progress/feedback label (hidden initially)
-        self.progress_label = QLabel("⏳ Processing...")
-        self.progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.progress_label.setStyleSheet("""
-            QLabel {
-                color: #1976D2;
-                font-size: 14px;
-                padding: 10px;
-                background-color: #e3f2fd;
-                border-radius: 5px;
-            }
-        """)
-        self.progress_label.hide()
-        layout.addWidget(self.progress_label)
-        
-        # Text area for results (hidden initially)
-        self.text_area = QTextEdit()
-        self.text_area.setReadOnly(True)
-        self.text_area.setPlaceholderText("Extracted text will appear here...")
-        self.text_area.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                padding: 10px;
-                font-family: monospace;
-                font-size: 12px;
-            }
-        """)
-        self.text_area.hide()
-        layout.addWidget(self.text_area, 1)  # Stretch factor of 1
-        
-        # Button container for copy and retry buttons
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(10)
-        
-        # Copy button (hidden initially)
-        self.copy_btn = QPushButton("📋 Copy to Clipboard")
-        self.copy_btn.setMinimumHeight(35)
-        self.copy_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-            QPushButton:pressed {
-                background-color: #E65100;
-            }
-        """)
-        self.copy_btn.clicked.connect(self._copy_to_clipboard)
-        self.copy_btn.hide()
-        button_layout.addWidget(self.copy_btn)
-        
-        # Try again button (hidden initially)
-        self.retry_btn = QPushButton("🔄 Try Again")
-        self.retry_btn.setMinimumHeight(35)
-        self.retry_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #d32f2f;
-            }
-            QPushButton:pressed {
-                background-color: #b71c1c;
-            }
-        """)
-        self.retry_btn.clicked.connect(self._retry_ocr)
-        self.retry_btn.hide()
-        button_layout.addWidget(self.retry_btn)
-        
-        # Start over button (hidden initially)
-        self.start_over_btn = QPushButton("🏠 Start Over")
-        self.start_over_btn.setMinimumHeight(35)
-        self.start_over_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9E9E9E;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #757575;
-            }
-            QPushButton:pressed {
-                background-color: #616161;
-            }
-        """)
-        self.start_over_btn.clicked.connect(self._start_over)
-        self.start_over_btn.hide()
-        button_layout.addWidget(self.start_over_btn)
-        
-        layout.addLayout(button_layout)
+        self._main_layout.addWidget(self.open_btn)
+        
+        # Button container for copy and retry buttons - the buttons themselves,
+        # like every widget below the open button, are built on first use
+        self._button_layout = QHBoxLayout()
+        self._button_layout.setSpacing(10)
+        self._main_layout.addLayout(self._button_layout)
+    
+    def _is_built(self, name: str) -> bool:
+        """Check whether a lazily built widget exists yet"""
+        return name in self.__dict__
+    
+    def _place_widget(self, name: str, widget: QWidget):
+        """
+        Add a lazily built widget to its layout, after the built widgets that come before it
+        
+        Args:
+            name (str): Attribute name of the widget
+            widget (QWidget): The widget
+        """
+        for layout, order in ((self._main_layout, MAIN_LAYOUT_WIDGETS),
+                              (self._button_layout, BUTTON_LAYOUT_WIDGETS)):
+            if name in order:
+                index = sum(1 for other in order[:order.index(name)] if self._is_built(other))
+                # The results area takes up the spare height
+                layout.insertWidget(index, widget, 1 if name == 'text_area' else 0)
+                return
+    
+    def _build_file_label(self) -> QLabel:
+        """File name label"""
+        file_label = QLabel("")
+        file_label.setStyleSheet(FILE_LABEL_STYLE)
+        return file_label
+    
+    def _build_force_ocr_check(self) -> QCheckBox:
+        """Option to OCR PDFs that already contain text (their text layer is used otherwise)"""
+        force_ocr_check = QCheckBox("Force OCR (ignore existing text layer)")
+        force_ocr_check.setStyleSheet(FORCE_OCR_STYLE)
+        return force_ocr_check
+    
+    def _build_start_ocr_btn(self) -> QPushButton:
+        """Start OCR button"""
+        start_ocr_btn = QPushButton("🚀 Start OCR")
+        start_ocr_btn.setMinimumHeight(40)
+        start_ocr_btn.setStyleSheet(START_BUTTON_STYLE)
+        start_ocr_btn.clicked.connect(self._start_ocr)
+        return start_ocr_btn
+    
+    def _build_progress_label(self) -> QLabel:
+        """Progress/feedback label"""
+        progress_label = QLabel("⏳ Processing...")
+        progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        progress_label.setStyleSheet(PROGRESS_INFO_STYLE)
+        return progress_label
+    
+    def _build_text_area(self) -> QTextEdit:
+        """Text area for results"""
+        text_area = QTextEdit()
+        text_area.setReadOnly(True)
+        # Text is only ever appended by the app - no undo history to keep
+        text_area.setUndoRedoEnabled(False)
+        text_area.setPlaceholderText("Extracted text will appear here...")
+        text_area.setStyleSheet(TEXT_AREA_STYLE)
+        return text_area
+    
+    def _build_copy_btn(self) -> QPushButton:
+        """Copy button"""
+        copy_btn = QPushButton("📋 Copy to Clipboard")
+        copy_btn.setMinimumHeight(35)
+        copy_btn.setStyleSheet(COPY_BUTTON_STYLE)
+        copy_btn.clicked.connect(self._copy_to_clipboard)
+        return copy_btn
+    
+    def _build_retry_btn(self) -> QPushButton:
+        """Try again button"""
+        retry_btn = QPushButton("🔄 Try Again")
+        retry_btn.setMinimumHeight(35)
+        retry_btn.setStyleSheet(RETRY_BUTTON_STYLE)
+        retry_btn.clicked.connect(self._retry_ocr)
+        return retry_btn
+    
+    def _build_start_over_btn(self) -> QPushButton:
+        """Start over button"""
+        start_over_btn = QPushButton("🏠 Start Over")
+        start_over_btn.setMinimumHeight(35)
+        start_over_btn.setStyleSheet(START_OVER_BUTTON_STYLE)
+        start_over_btn.clicked.connect(self._start_over)
+        return start_over_btn
+    
+    def _build_toast(self) -> QLabel:
+        """Copy confirmation - floats over the window instead of a modal dialog"""
+        toast = QLabel(self)
+        toast.setStyleSheet(TOAST_STYLE)
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.setInterval(self.TOAST_DURATION)
+        self._toast_timer.timeout.connect(toast.hide)
+        return toast
     
     def _open_file_dialog(self):
         """Open file picker dialog"""
-        file_path, _ = QFileDialog.getOpenFileName(
+        file_paths, _ = QFileDialog.getOpenFileNames(
             self,
-            "Select PDF File",
+            "Select PDF Files",
             "",
             "PDF Files (*.pdf)"
         )
         
-        if file_path:
-            self._on_file_dropped(file_path)
+        if file_paths:
+            self._enqueue_files(file_paths)
+    
+    def _enqueue_files(self, file_paths: list):
+        """
+        Select one or more PDFs (drag-drop or file picker)
+        
+        The first file is selected as before; the others are queued and OCRed
+        after it without further clicks.
+        
+        Args:
+            file_paths (list): Paths of the selected PDF files
+        """
+        # Drops are refused while processing, but a drop already in flight (or a
+        # file dialog opened just before) could still arrive
+        if self._state is UIState.PROCESSING:
+            return
+        self.file_queue = deque(file_paths[1:])
+        self.batch_texts = [] if len(file_paths) > 1 else None
+        self.batch_size = len(file_paths)
+        self.batch_failures = 0
+        self._on_file_dropped(file_paths[0])
+        if self.file_queue:
+            self.file_label.setText(f"Selected: {os.path.basename(file_paths[0])} (+{len(self.file_queue)} more)")
     
     def _on_file_dropped(self, file_path: str):
         """Handle file selection (drag-drop or file picker)"""
         self.current_file = file_path
-        file_name = Path(file_path).name
+        file_name = os.path.basename(file_path)
         
         # Update UI
         self.drop_zone.setText(f"✅ {file_name}")
         self.file_label.setText(f"Selected: {file_name}")
-        self.file_label.show()
-        self.start_ocr_btn.show()
         
         # Hide previous results
-        self.text_area.hide()
-        self.text_area.clear()
-        self.copy_btn.hide()
-        self.retry_btn.hide()
-        self.start_over_btn.hide()
-        self.progress_label.hide()
+        if self._is_built('text_area'):
+            self.text_area.clear()
+        self._apply_state(UIState.FILE_SELECTED)
+    
+    def _batch_heading(self) -> str:
+        """
+        Get the heading the current file's text starts with in the results
+        
+        Returns:
+            str: File name heading for a batch, separated from the previous file ('' for a single file)
+        """
+        if self.batch_texts is None:
+            return ""
+        separator = "\n\n" if self.batch_texts else ""
+        return f"{separator}===== {os.path.basename(self.current_file)} =====\n"
+    
+    def _collect_batch_text(self, text: str) -> str:
+        """
+        Add a finished file's text to the batch results
+        
+        Args:
+            text (str): Extracted text (or error note) of the current file
+        
+        Returns:
+            str: Text to display - every finished file of the batch under its name
+        """
+        if self.batch_texts is None:
+            return text
+        self.batch_texts.append(f"===== {os.path.basename(self.current_file)} =====\n{text}")
+        return "\n\n".join(self.batch_texts)
+    
+    def _append_text(self, chunk: str):
+        """Add text at the end of the results area (leaves the user's selection alone)"""
+        cursor = self.text_area.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk)
+    
+    def _truncate_text(self, position: int):
+        """Remove everything after a position from the results area"""
+        cursor = self.text_area.textCursor()
+        cursor.setPosition(position)
+        cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+    
+    def _start_next_queued(self) -> bool:
+        """
+        Start OCR on the next queued file, if any
+        
+        Returns:
+            bool: True if another file was started
+        """
+        if not self.file_queue:
+            return False
+        
+        self.current_file = self.file_queue.popleft()
+        file_name = os.path.basename(self.current_file)
+        done = self.batch_size - len(self.file_queue)
+        self.drop_zone.setText(f"✅ {file_name}")
+        self.file_label.setText(f"Processing: {file_name} ({done} of {self.batch_size})")
+        self._run_ocr()
+        return True
     
     def _start_ocr(self):
-        """Start OCR processing in background thread"""
-        if not self.current_file:
+        """Start OCR processing in background thread (ignored while a run is in progress)"""
+        # A click queued before the button was disabled must not start a second run
+        if self._state is UIState.PROCESSING or not self.current_file:
             return
+        self._run_ocr()
+    
+    def _run_ocr(self):
+        """Start OCR on the current file (also used to continue a batch)"""
+        # Show progress - buttons are disabled during processing
+        self.progress_label.setText("⏳ Converting PDF to images...")
+        self.progress_label.setStyleSheet(PROGRESS_INFO_STYLE)
+        self._apply_state(UIState.PROCESSING)
         
-        # Disable buttons during processing
-        self.start_ocr_btn.setEnabled(False)
-        self.open_btn.setEnabled(False)
-        self.drop_zone.setAcceptDrops(False)
+        # Pages are appended to the results as they are done (see _on_page_ready)
+        if self.batch_texts is None:
+            self.text_area.clear()
+        self._file_text_start = self.text_area.document().characterCount() - 1
+        self._append_text(self._batch_heading())
         
-        # Show progress
-        self.progress_label.setText("⏳ Converting PDF to images...")
-        self.progress_label.setStyleSheet("""
-            QLabel {
-                color: #1976D2;
-                font-size: 14px;
-                padding: 10px;
-                background-color: #e3f2fd;
-                border-radius: 5px;
-            }
-        """)
-        self.progress_label.show()
-        
-        # Create worker thread
-        self.ocr_thread = QThread()
-        self.ocr_worker = OCRWorker(self.current_file)
-        self.ocr_worker.moveToThread(self.ocr_thread)
-        
-        # Connect signals
-        self.ocr_thread.started.connect(self.ocr_worker.run)
-        self.ocr_worker.progress.connect(self._on_progress)
-        self.ocr_worker.finished.connect(self._on_ocr_success)
-        self.ocr_worker.error.connect(self._on_ocr_error)
-        self.ocr_worker.finished.connect(self.ocr_thread.quit)
-        self.ocr_worker.error.connect(self.ocr_thread.quit)
-        self.ocr_worker.finished.connect(self.ocr_worker.deleteLater)
-        self.ocr_worker.error.connect(self.ocr_worker.deleteLater)
-        self.ocr_thread.finished.connect(self.ocr_thread.deleteLater)
+        # Create the OCR task - the pool deletes it once it has run; its signals
+        # object is kept here until the task has finished (see _disconnect_worker())
+        worker = OCRWorker(self.current_file, use_text_layer=not self.force_ocr_check.isChecked())
+        self.ocr_signals = worker.signals
+        
+        # Connect signals - queued, so the slots run on the GUI thread
+        queued = Qt.ConnectionType.QueuedConnection
+        self.ocr_signals.progress.connect(self._on_progress, queued)
+        self.ocr_signals.page_ready.connect(self._on_page_ready, queued)
+        self.ocr_signals.finished.connect(self._on_ocr_success, queued)
+        self.ocr_signals.error.connect(self._on_ocr_error, queued)
         
         # Start processing
-        self.ocr_thread.start()
+        self.ocr_pool.start(worker)
+    
+    def _on_page_ready(self, chunk: str):
+        """Show the next page's text - the user can read it while the rest is OCRed"""
+        self._append_text(chunk)
+        self._set_visible(self.text_area, True)
     
     def _on_progress(self, message: str):
-        """Update progress message"""
-        self.progress_label.setText(f"⏳ {message}")
+        """Update progress message (coalesced - see _flush_progress())"""
+        self._pending_progress = message
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """Show the latest progress message"""
+        if self._pending_progress is not None:
+            self.progress_label.setText(f"⏳ {self._pending_progress}")
+            self._pending_progress = None
+    
+    def _disconnect_worker(self):
+        """
+        Release the finished task's signals
+        
+        Called when its finished or error signal arrives - it emits nothing
+        after that, and signals queued before it have been delivered already.
+        """
+        signals = self.ocr_signals
+        self.ocr_signals = None
+        for signal in (signals.progress, signals.page_ready, signals.finished, signals.error):
+            try:
+                signal.disconnect()
+            except RuntimeError:
+                pass
+        signals.deleteLater()
+    
+    def _stop_progress(self):
+        """Drop any progress message not shown yet (the OCR run has ended)"""
+        self._progress_timer.stop()
+        self._pending_progress = None
     
     def _on_ocr_success(self, text: str):
         """Handle successful OCR completion"""
-        self.progress_label.setText("✅ OCR completed successfully!")
-        self.progress_label.setStyleSheet("""
-            QLabel {
-                color: #2E7D32;
-                font-size: 14px;
-                padding: 10px;
-                background-color: #C8E6C9;
-                border-radius: 5px;
-            }
-        """)
-        
-        # Show results
-        self.text_area.setPlainText(text)
-        self.text_area.show()
-        self.copy_btn.show()
-        self.start_over_btn.show()
-        
-        # Re-enable controls
-        self.start_ocr_btn.setEnabled(True)
-        self.open_btn.setEnabled(True)
-        self.drop_zone.setAcceptDrops(True)
+        self._disconnect_worker()
+        self._stop_progress()
+        # The results area already holds the text - it was streamed page by page
+        self._finish_file(self._collect_batch_text(text))
+    
+    def _finish_file(self, text: str):
+        """
+        Continue with the next queued file, or show the results once all are done
+        
+        Args:
+            text (str): Text to display and copy - every finished file of a batch
+        """
+        if self._start_next_queued():
+            return
+        if self.batch_texts is not None:
+            self.file_label.setText(f"Processed {self.batch_size} files")
+        
+        if self.batch_failures:
+            self.progress_label.setText(f"⚠️ OCR completed with {self.batch_failures} failure(s)")
+            self.progress_label.setStyleSheet(PROGRESS_WARNING_STYLE)
+        else:
+            self.progress_label.setText("✅ OCR completed successfully!")
+            self.progress_label.setStyleSheet(PROGRESS_SUCCESS_STYLE)
+        
+        # Show results and re-enable controls
+        self._last_text = text
+        self._apply_state(UIState.SUCCESS)
     
     def _on_ocr_error(self, error_msg: str):
         """Handle OCR error"""
+        self._disconnect_worker()
+        self._stop_progress()
+        # Drop the pages of the failed file that were already shown
+        self._truncate_text(self._file_text_start)
+        
+        # A failed file doesn't stop the rest of the batch - it gets a one-line
+        # note in the results (the details, with any traceback, go to the console)
+        if self.batch_texts is not None:
+            print(f"OCR failed for {self.current_file}: {error_msg}")
+            self.batch_failures += 1
+            summary = error_msg.splitlines()[0] if error_msg else "Unknown error"
+            error_note = f"[OCR Error: {summary}]"
+            self._append_text(self._batch_heading() + error_note)
+            self._finish_file(self._collect_batch_text(error_note))
+            return
+        
+        # The failed file's pages were removed - hide the results area if it is empty now
+        self._set_visible(self.text_area, not self.text_area.document().isEmpty())
+        
         self.progress_label.setText(f"❌ Error: {error_msg}")
-        self.progress_label.setStyleSheet("""
-            QLabel {
-                color: #C62828;
-                font-size: 14px;
-                padding: 10px;
-                background-color: #FFCDD2;
-                border-radius: 5px;
-            }
-        """)
-        
-        # Show retry buttons
-        self.retry_btn.show()
-        self.start_over_btn.show()
-        
-        # Re-enable controls
-        self.start_ocr_btn.setEnabled(True)
-        self.open_btn.setEnabled(True)
-        self.drop_zone.setAcceptDrops(True)
+        self.progress_label.setStyleSheet(PROGRESS_ERROR_STYLE)
+        
+        # Show retry buttons and re-enable controls
+        self._apply_state(UIState.ERROR)
     
     def _copy_to_clipboard(self):
         """Copy text to clipboard (works on macOS, Linux, Windows)"""
-        from PySide6.QtGui import QGuiApplication
-        
-        text = self.text_area.toPlainText()
-        clipboard = QGuiApplication.clipboard()
-        clipboard.setText(text)
-        
-        # Show confirmation
-        QMessageBox.information(
-            self,
-            "Copied",
-            "Text copied to clipboard!",
-            QMessageBox.StandardButton.Ok
+        QGuiApplication.clipboard().setText(self._last_text)
+        self._show_toast("✅ Copied")
+    
+    def _show_toast(self, message: str):
+        """Show a short message at the bottom of the window (hides itself)"""
+        self._toast.setText(message)
+        self._toast.adjustSize()
+        self._toast.move(
+            (self.width() - self._toast.width()) // 2,
+            self.height() - self._toast.height() - 20
         )
+        self._toast.raise_()
+        self._toast.show()
+        # Restarting the timer keeps the toast up for a full interval after each copy
+        self._toast_timer.start()
     
     def _retry_ocr(self):
         """Retry OCR on the same file"""
-        self.retry_btn.hide()
-        self.progress_label.hide()
         self._start_ocr()
     
     def _start_over(self):
         """Reset to initial state"""
         self.current_file = None
+        self.file_queue.clear()
+        self.batch_texts = None
+        self.batch_size = 0
+        self.batch_failures = 0
         
         # Reset drop zone
         self.drop_zone.setText("📄 Drop PDF file here")
-        self.drop_zone.setAcceptDrops(True)
-        
-        # Hide all optional elements
-        self.file_label.hide()
-        self.start_ocr_btn.hide()
-        self.progress_label.hide()
-        self.text_area.hide()
-        self.text_area.clear()
-        self.copy_btn.hide()
-        self.retry_btn.hide()
-        self.start_over_btn.hide()
-        
-        # Re-enable controls
-        self.start_ocr_btn.setEnabled(True)
-        self.open_btn.setEnabled(True)
+        
+        # Hide all optional elements and re-enable controls
+        if self._is_built('text_area'):
+            self.text_area.clear()
+        self._last_text = ""
+        self._apply_state(UIState.IDLE)
+    
+    def _apply_state(self, state: UIState):
+        """
+        Show, hide, enable and disable widgets for a workflow state
+        
+        Only widgets not already in their target state are touched - every
+        show/hide/enable change makes Qt re-polish the widget and re-run the layout.
+        
+        Args:
+            state (UIState): State to switch to
+        """
+        for name, visible in STATE_VISIBILITY[state].items():
+            # A widget that was never built is hidden already
+            if visible or self._is_built(name):
+                self._set_visible(getattr(self, name), visible)
+        
+        # Everything that starts a new run is disabled while one is in progress
+        enabled = state is not UIState.PROCESSING
+        for name in ('force_ocr_check', 'start_ocr_btn', 'open_btn'):
+            if self._is_built(name):
+                widget = getattr(self, name)
+                if widget.isEnabled() != enabled:
+                    widget.setEnabled(enabled)
+        if self.drop_zone.acceptDrops() != enabled:
+            self.drop_zone.setAcceptDrops(enabled)
+        
+        self._state = state
+    
+    @staticmethod
+    def _set_visible(widget: QWidget, visible: bool):
+        """Show or hide a widget unless it already is (isHidden() ignores the parents' visibility)"""
+        if widget.isHidden() == visible:
+            widget.setVisible(visible)